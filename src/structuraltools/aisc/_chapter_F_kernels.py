@@ -0,0 +1,169 @@
+# Copyright 2025 Joe Bears
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from math import pi, sqrt
+
+from numpy import clip, maximum, minimum, nan, ndarray, where
+from numpy import sqrt as array_sqrt
+
+# Numeric kernels for AISC 360-22 Chapter F. All arguments and results are
+# plain floats or float arrays in kip, inch, and ksi, so no unit handling or
+# template filling is done here. The *_array kernels evaluate every branch
+# and select the governing one elementwise, so they broadcast over arrays of
+# section properties, L_b, and C_b.
+
+_pi_squared = pi**2
+
+
+def sec_F2_2(F_y: float, E: float, S_x: float, r_ts: float, J: float, c: float,
+        h_o: float, M_p: float, L_p: float, L_r: float, L_b: float,
+        C_b: float) -> float:
+    """Lateral-torsional buckling moment according to AISC 360-22 Section F2.2
+    in kip*inch"""
+    if L_b <= L_p:
+        return M_p
+    if L_b <= L_r:
+        return C_b*(M_p-(M_p-0.7*F_y*S_x)*(L_b-L_p)/(L_r-L_p))
+    slenderness = (L_b/r_ts)**2
+    F_cr = C_b*E*_pi_squared/slenderness*sqrt(1+0.078*J*c/(S_x*h_o)*slenderness)
+    return F_cr*S_x
+
+def sec_F3_2(F_y: float, E: float, S_x: float, M_p: float, lamb_f: float,
+        lamb_w: float) -> float:
+    """Compression flange local buckling moment according to AISC 360-22
+    Section F3.2 in kip*inch"""
+    lamb_rf = sqrt(E/F_y)
+    lamb_pf = 0.38*lamb_rf
+    if lamb_f < lamb_rf:
+        return M_p-(M_p-0.7*F_y*S_x)*(lamb_f-lamb_pf)/(lamb_rf-lamb_pf)
+    k_c = 4/sqrt(lamb_w)
+    k_c = 0.35 if k_c < 0.35 else 0.76 if k_c > 0.76 else k_c
+    return 0.9*E*k_c*S_x/lamb_f**2
+
+def sec_F2(F_y: float, E: float, S_x: float, r_ts: float, J: float, c: float,
+        h_o: float, M_p: float, L_p: float, L_r: float, L_b: float,
+        C_b: float) -> float:
+    """Nominal moment capacity according to AISC 360-22 Section F2 in kip*inch"""
+    M_ltb = sec_F2_2(F_y, E, S_x, r_ts, J, c, h_o, M_p, L_p, L_r, L_b, C_b)
+    return min(M_p, M_ltb)
+
+def sec_F3(F_y: float, E: float, S_x: float, r_ts: float, J: float, c: float,
+        h_o: float, M_p: float, L_p: float, L_r: float, M_flb: float, L_b: float,
+        C_b: float) -> float:
+    """Nominal moment capacity according to AISC 360-22 Section F3 in kip*inch.
+    The compression flange local buckling moment (M_flb) does not depend on
+    L_b or C_b, so it is calculated once per section with sec_F3_2."""
+    M_ltb = sec_F2_2(F_y, E, S_x, r_ts, J, c, h_o, M_p, L_p, L_r, L_b, C_b)
+    return min(M_ltb, M_flb)
+
+def sec_F11(F_y: float, E: float, Z_x: float, S_x: float, d: float, t: float,
+        L_b: float, C_b: float) -> float:
+    """Nominal moment capacity of a rectangular bar according to AISC 360-22
+    Section F11 in kip*inch"""
+    M_p = F_y*min(Z_x, 1.5*S_x)
+    lamb = L_b*d/t**2
+    E_F_y = E/F_y
+    if lamb <= 0.08*E_F_y:
+        return M_p
+    if lamb <= 1.9*E_F_y:
+        M_ltb = C_b*(1.52-0.274*lamb*F_y/E)*F_y*S_x
+    else:
+        M_ltb = 1.9*E*C_b/lamb*S_x
+    return min(M_p, M_ltb)
+
+def F2_limits_array(F_y: ndarray, E: ndarray, S_x: ndarray, r_y: ndarray,
+        r_ts: ndarray, J: ndarray, c: ndarray, h_o: ndarray) -> tuple[ndarray, ndarray]:
+    """Elementwise limiting lengths L_p and L_r according to AISC 360-22
+    Equations F2-5 and F2-6 in inch"""
+    L_p = 1.76*r_y*array_sqrt(E/F_y)
+    J_c = J*c/(S_x*h_o)
+    F_y_E = 0.7*F_y/E
+    L_r = 1.95*r_ts/F_y_E*array_sqrt(J_c+array_sqrt(J_c**2+6.76*F_y_E**2))
+    return L_p, L_r
+
+def sec_F2_2_array(F_y: ndarray, E: ndarray, S_x: ndarray, r_ts: ndarray,
+        J: ndarray, c: ndarray, h_o: ndarray, M_p: ndarray, L_p: ndarray,
+        L_r: ndarray, L_b: ndarray, C_b: ndarray) -> ndarray:
+    """Elementwise lateral-torsional buckling moment according to
+    AISC 360-22 Section F2.2 in kip*inch"""
+    M_inelastic = C_b*(M_p-(M_p-0.7*F_y*S_x)*(L_b-L_p)/(L_r-L_p))
+    # The elastic branch is only selected where L_b > L_r, so evaluating it
+    # with L_b limited to at least L_r avoids dividing by zero elsewhere
+    slenderness = (maximum(L_b, L_r)/r_ts)**2
+    M_elastic = C_b*E*_pi_squared/slenderness \
+        *array_sqrt(1+0.078*J*c/(S_x*h_o)*slenderness)*S_x
+    return where(L_b <= L_p, M_p, where(L_b <= L_r, M_inelastic, M_elastic))
+
+def sec_F3_2_array(F_y: ndarray, E: ndarray, S_x: ndarray, M_p: ndarray,
+        lamb_f: ndarray, lamb_w: ndarray) -> ndarray:
+    """Elementwise compression flange local buckling moment according to
+    AISC 360-22 Section F3.2 in kip*inch"""
+    lamb_rf = array_sqrt(E/F_y)
+    lamb_pf = 0.38*lamb_rf
+    M_noncompact = M_p-(M_p-0.7*F_y*S_x)*(lamb_f-lamb_pf)/(lamb_rf-lamb_pf)
+    k_c = clip(4/array_sqrt(lamb_w), 0.35, 0.76)
+    M_slender = 0.9*E*k_c*S_x/lamb_f**2
+    return where(lamb_f < lamb_rf, M_noncompact, M_slender)
+
+def sec_F2_array(F_y: ndarray, E: ndarray, Z_x: ndarray, S_x: ndarray,
+        r_y: ndarray, r_ts: ndarray, J: ndarray, c: ndarray, h_o: ndarray,
+        L_b: ndarray, C_b: ndarray) -> ndarray:
+    """Elementwise nominal moment capacity according to AISC 360-22 Section F2
+    in kip*inch"""
+    M_p = F_y*Z_x
+    L_p, L_r = F2_limits_array(F_y, E, S_x, r_y, r_ts, J, c, h_o)
+    M_ltb = sec_F2_2_array(F_y, E, S_x, r_ts, J, c, h_o, M_p, L_p, L_r, L_b, C_b)
+    return minimum(M_p, M_ltb)
+
+def sec_F3_array(F_y: ndarray, E: ndarray, Z_x: ndarray, S_x: ndarray,
+        r_y: ndarray, r_ts: ndarray, J: ndarray, c: ndarray, h_o: ndarray,
+        lamb_f: ndarray, lamb_w: ndarray, L_b: ndarray, C_b: ndarray) -> ndarray:
+    """Elementwise nominal moment capacity according to AISC 360-22 Section F3
+    in kip*inch"""
+    M_p = F_y*Z_x
+    L_p, L_r = F2_limits_array(F_y, E, S_x, r_y, r_ts, J, c, h_o)
+    M_ltb = sec_F2_2_array(F_y, E, S_x, r_ts, J, c, h_o, M_p, L_p, L_r, L_b, C_b)
+    M_flb = sec_F3_2_array(F_y, E, S_x, M_p, lamb_f, lamb_w)
+    return minimum(M_ltb, M_flb)
+
+def sec_F2_F3_array(F_y: ndarray, E: ndarray, Z_x: ndarray, S_x: ndarray,
+        r_y: ndarray, r_ts: ndarray, J: ndarray, c: ndarray, h_o: ndarray,
+        lamb_f: ndarray, lamb_w: ndarray, L_b: ndarray, C_b: ndarray) -> ndarray:
+    """Elementwise nominal moment capacity of I sections according to
+    AISC 360-22 Section F2 for compact flanges or Section F3 for noncompact and
+    slender flanges in kip*inch. Sections with noncompact or slender webs are
+    not covered by either section and are returned as nan."""
+    M_p = F_y*Z_x
+    L_p, L_r = F2_limits_array(F_y, E, S_x, r_y, r_ts, J, c, h_o)
+    M_ltb = sec_F2_2_array(F_y, E, S_x, r_ts, J, c, h_o, M_p, L_p, L_r, L_b, C_b)
+    M_flb = sec_F3_2_array(F_y, E, S_x, M_p, lamb_f, lamb_w)
+    root_E_F_y = array_sqrt(E/F_y)
+    M_n = where(lamb_f < 0.38*root_E_F_y, minimum(M_p, M_ltb), minimum(M_ltb, M_flb))
+    return where(lamb_w < 3.76*root_E_F_y, M_n, nan)
+
+def sec_F11_array(F_y: ndarray, E: ndarray, Z_x: ndarray, S_x: ndarray,
+        d: ndarray, t: ndarray, L_b: ndarray, C_b: ndarray) -> ndarray:
+    """Elementwise nominal moment capacity of a rectangular bar according to
+    AISC 360-22 Section F11 in kip*inch"""
+    M_p = F_y*minimum(Z_x, 1.5*S_x)
+    lamb = L_b*d/t**2
+    E_F_y = E/F_y
+    lamb_r = 1.9*E_F_y
+    M_inelastic = C_b*(1.52-0.274*lamb*F_y/E)*F_y*S_x
+    # As in sec_F2_2_array, the elastic branch is evaluated with lamb limited
+    # to at least lamb_r so unselected elements do not divide by zero
+    M_elastic = 1.9*E*C_b/maximum(lamb, lamb_r)*S_x
+    M_ltb = where(lamb <= 0.08*E_F_y, M_p, where(lamb <= lamb_r, M_inelastic, M_elastic))
+    return minimum(M_p, M_ltb)
@@ -15,11 +15,10 @@
 
 import importlib.resources
 import json
-
-from numpy import sqrt
+from math import sqrt
 
 from structuraltools.unit import Stress
-from structuraltools.utils import fill_template, Result
+from structuraltools.utils import cache_values, fill_template, Result, string_requested
 
 
 resources = importlib.resources.files("structuraltools.aisc.resources")
@@ -27,6 +26,7 @@ with open(resources.joinpath("chapter_B_templates_processed.json")) as file:
     templates = json.load(file)
 
 
+@cache_values
 def table_B4_1b_10_lamb_p(E: Stress, F_y: Stress, **string_options) -> Result[float]:
     """Calculate the case 10 compact/non-compact limiting width-to-thickness
     ratio from AISC 360-22 Table B4.1b
@@ -39,9 +39,13 @@ def table_B4_1b_10_lamb_p(E: Stress, F_y: Stress, **string_options) -> Result[fl
 
     F_y : Stress
         Steel yield stress"""
-    lamb_pf = 0.38*sqrt(E/F_y).to("dimensionless").magnitude
-    return fill_template(lamb_pf, templates["table_B4_1b_10_lamb_p"], locals(), **string_options)
+    lamb_pf = 0.38*sqrt(E.m_as("ksi")/F_y.m_as("ksi"))
+    if not string_requested(string_options):
+        return Result("", lamb_pf)
+    return fill_template(lamb_pf, templates["table_B4_1b_10_lamb_p"],
+        {"E": E, "F_y": F_y, "lamb_pf": lamb_pf}, **string_options)
 
+@cache_values
 def table_B4_1b_10_lamb_r(E: Stress, F_y: Stress, **string_options) -> Result[float]:
     """Calculate the case 10 non-compact/slender limiting width-to-thickness
     ratio from AISC 360-22 Table B4.1b
@@ -54,9 +58,13 @@ def table_B4_1b_10_lamb_r(E: Stress, F_y: Stress, **string_options) -> Result[fl
 
     F_y : Stress
         Steel yield stress"""
-    lamb_rf = sqrt(E/F_y).to("dimensionless").magnitude
-    return fill_template(lamb_rf, templates["table_B4_1b_10_lamb_r"], locals(), **string_options)
+    lamb_rf = sqrt(E.m_as("ksi")/F_y.m_as("ksi"))
+    if not string_requested(string_options):
+        return Result("", lamb_rf)
+    return fill_template(lamb_rf, templates["table_B4_1b_10_lamb_r"],
+        {"E": E, "F_y": F_y, "lamb_rf": lamb_rf}, **string_options)
 
+@cache_values
 def table_B4_1b_15_lamb_p(E: Stress, F_y: Stress, **string_options) -> Result[float]:
     """Calculate the case 15 compact/non-compact limiting width-to-thickness
     ratio from AISC 360-22 Table B4.1b
@@ -69,9 +77,13 @@ def table_B4_1b_15_lamb_p(E: Stress, F_y: Stress, **string_options) -> Result[fl
 
     F_y : Stress
         Steel yield stress"""
-    lamb_pw = 3.76*sqrt(E/F_y).to("dimensionless").magnitude
-    return fill_template(lamb_pw, templates["table_B4_1b_15_lamb_p"], locals(), **string_options)
+    lamb_pw = 3.76*sqrt(E.m_as("ksi")/F_y.m_as("ksi"))
+    if not string_requested(string_options):
+        return Result("", lamb_pw)
+    return fill_template(lamb_pw, templates["table_B4_1b_15_lamb_p"],
+        {"E": E, "F_y": F_y, "lamb_pw": lamb_pw}, **string_options)
 
+@cache_values
 def table_B4_1b_15_lamb_r(E: Stress, F_y: Stress, **string_options) -> Result[float]:
     """Calculate the case 15 non-compact/slender limiting width-to-thickness
     ratio from AISC 360-22 Table B4.1b
@@ -84,5 +96,8 @@ def table_B4_1b_15_lamb_r(E: Stress, F_y: Stress, **string_options) -> Result[fl
 
     F_y : Stress
         Steel yield stress"""
-    lamb_rw = 5.7*sqrt(E/F_y).to("dimensionless").magnitude
-    return fill_template(lamb_rw, templates["table_B4_1b_15_lamb_r"], locals(), **string_options)
+    lamb_rw = 5.7*sqrt(E.m_as("ksi")/F_y.m_as("ksi"))
+    if not string_requested(string_options):
+        return Result("", lamb_rw)
+    return fill_template(lamb_rw, templates["table_B4_1b_15_lamb_r"],
+        {"E": E, "F_y": F_y, "lamb_rw": lamb_rw}, **string_options)
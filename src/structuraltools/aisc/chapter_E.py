@@ -13,19 +13,26 @@
 # limitations under the License.
 
 
+from functools import cache
 import importlib.resources
 import json
+from math import exp, log, pi
 
-from numpy import pi
-
-from structuraltools.unit import Area, Force, Length, Stress
-from structuraltools.utils import fill_template, Result
+from structuraltools.unit import unit, Area, Force, Length, Stress
+from structuraltools.utils import cache_values, fill_template, Result, string_requested
 
 
 resources = importlib.resources.files("structuraltools.aisc.resources")
-with open(resources.joinpath("chapter_E_templates_processed.json")) as file:
-    templates = json.load(file)
+_pi_squared = pi**2
+_log_0_658 = log(0.658)
+
 
+@cache
+def _templates() -> dict[str, str]:
+    """Load the chapter E templates on first use so importing the module does
+    not read the template file"""
+    with open(resources.joinpath("chapter_E_templates_processed.json")) as file:
+        return json.load(file)
 
 def eq_E3_1(F_n: Stress, A_g: Area, **string_options) -> Result[Force]:
     """AISC 360-22 Equation E3-1
@@ -38,8 +45,11 @@ def eq_E3_1(F_n: Stress, A_g: Area, **string_options) -> Result[Force]:
 
     A_g : Area
         Gross area of member"""
-    P_n = (F_n*A_g).to("kip")
-    return fill_template(P_n, templates["eq_E3_1"], locals(), **string_options)
+    P_n = F_n.m_as("ksi")*A_g.m_as("inch**2")*unit.kip
+    if not string_requested(string_options):
+        return Result("", P_n)
+    return fill_template(P_n, _templates()["eq_E3_1"],
+        {"F_n": F_n, "A_g": A_g, "P_n": P_n}, **string_options)
 
 def eq_E3_2(F_y: Stress, F_e: Stress, **string_options) -> Result[Stress]:
     """AISC 360-22 Equation E3-2
@@ -52,8 +62,12 @@ def eq_E3_2(F_y: Stress, F_e: Stress, **string_options) -> Result[Stress]:
 
     F_e : Stress
         Elastic buckling stress"""
-    F_n = (0.658**(F_y/F_e)*F_y).to("ksi")
-    return fill_template(F_n, templates["eq_E3_2"], locals(), **string_options)
+    F_y_ksi = F_y.m_as("ksi")
+    F_n = exp(F_y_ksi/F_e.m_as("ksi")*_log_0_658)*F_y_ksi*unit.ksi
+    if not string_requested(string_options):
+        return Result("", F_n)
+    return fill_template(F_n, _templates()["eq_E3_2"],
+        {"F_y": F_y, "F_e": F_e, "F_n": F_n}, **string_options)
 
 def eq_E3_3(F_e: Stress, **string_options) -> Result[Stress]:
     """AISC 360-22 Equation E3-3
@@ -63,8 +77,11 @@ def eq_E3_3(F_e: Stress, **string_options) -> Result[Stress]:
 
     F_e : Stress
         Elastic buckling stress"""
-    F_n = (0.877*F_e).to("ksi")
-    return fill_template(F_n, templates["eq_E3_3"], locals(), **string_options)
+    F_n = 0.877*F_e.m_as("ksi")*unit.ksi
+    if not string_requested(string_options):
+        return Result("", F_n)
+    return fill_template(F_n, _templates()["eq_E3_3"],
+        {"F_e": F_e, "F_n": F_n}, **string_options)
 
 def eq_E3_4(E: Stress, L_c: Length, r: Length, axis: str, **string_options
         ) -> Result[Stress]:
@@ -84,9 +101,13 @@ def eq_E3_4(E: Stress, L_c: Length, r: Length, axis: str, **string_options
 
     axis : str
         String indicating which member axis is being considered"""
-    F_e = ((pi**2*E)/((L_c/r)**2)).to("ksi")
-    return fill_template(F_e, templates["eq_E3_4"], locals(), **string_options)
+    F_e = _pi_squared*E.m_as("ksi")/(L_c.m_as("inch")/r.m_as("inch"))**2*unit.ksi
+    if not string_requested(string_options):
+        return Result("", F_e)
+    return fill_template(F_e, _templates()["eq_E3_4"],
+        {"E": E, "L_c": L_c, "r": r, "axis": axis, "F_e": F_e}, **string_options)
 
+@cache_values
 def sec_E3(section, L_c: Length, axis: str, **string_options) -> Result[Force]:
     """AISC 360-22 Section E3
 
@@ -107,9 +128,17 @@ def sec_E3(section, L_c: Length, axis: str, **string_options) -> Result[Force]:
     F_e_str, F_e = eq_E3_4(section.E, L_c, r, axis, **string_options)
     if F_y/F_e <= 2.25:
         F_n_str, F_n = eq_E3_2(F_y, F_e, **string_options)
-        template = templates["sec_E3_inelastic"]
+        template = "sec_E3_inelastic"
     else:
         F_n_str, F_n = eq_E3_3(F_e, **string_options)
-        template = templates["sec_E3_elastic"]
+        template = "sec_E3_elastic"
     P_n_str, P_n = eq_E3_1(F_n, section.A, **string_options)
-    return fill_template(P_n, template, locals(), **string_options)
+    if not string_requested(string_options):
+        return Result("", P_n)
+    return fill_template(P_n, _templates()[template], {
+        "F_y": F_y,
+        "F_e": F_e,
+        "F_e_str": F_e_str,
+        "F_n_str": F_n_str,
+        "P_n_str": P_n_str
+    }, **string_options)
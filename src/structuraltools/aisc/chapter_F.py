@@ -13,22 +13,169 @@
 # limitations under the License.
 
 
+from collections.abc import Callable, Mapping
+from functools import cache, wraps
 import importlib.resources
 import json
+from math import pi, sqrt
+from typing import Optional
 
-from numpy import pi, sqrt
+from numpy import array, minimum, ndarray, ndim, newaxis, take
 
+from structuraltools.aisc import _chapter_F_kernels as kernels
 from structuraltools.aisc import chapter_B
-from structuraltools.unit import (Length, Moment, MomentOfInertia,
-    SectionModulus, Stress, TorsionalConstant, WarpingConstant)
-from structuraltools.utils import fill_template, Result
+from structuraltools.unit import (unit, Length, Moment, MomentOfInertia,
+    NumericArray, SectionModulus, Stress, TorsionalConstant, WarpingConstant)
+from structuraltools.utils import cache_values, fill_template, Result, string_requested
 
 
 resources = importlib.resources.files("structuraltools.aisc.resources")
-with open(resources.joinpath("chapter_F_templates_processed.json")) as file:
-    templates = json.load(file)
+_pi_squared = pi**2
 
 
+@cache
+def _templates() -> dict[str, str]:
+    """Load the chapter F templates on first use so importing the module and
+    numeric only calculations do not read the template file"""
+    with open(resources.joinpath("chapter_F_templates_processed.json")) as file:
+        return json.load(file)
+
+
+def _cache_on_section(function: Callable) -> Callable:
+    """Decorator to store the return value of a function of a section in the
+    section's result_cache, so it is calculated once, released with the
+    section, and recalculated after the section is modified
+
+    Parameters
+    ==========
+
+    function : Callable
+        Function of a single section to cache the result of"""
+    @wraps(function)
+    def wrapper(section):
+        results = section.result_cache
+        if function not in results:
+            results[function] = function(section)
+        return results[function]
+
+    return wrapper
+
+
+@_cache_on_section
+def _F2_properties(section) -> tuple[float, ...]:
+    """Return the section properties and shape dependent limits used by the
+    scalar Section F2 kernels as floats in kip, inch, and ksi
+
+    Parameters
+    ==========
+
+    section : aisc.WideFlange
+        Section to get the properties of"""
+    return (
+        section.F_y.m_as("ksi"),
+        section.E.m_as("ksi"),
+        section.S_x.m_as("inch**3"),
+        section.r_ts.m_as("inch"),
+        section.J.m_as("inch**4"),
+        section.c,
+        section.h_o.m_as("inch"),
+        section.M_p.m_as("kipin"),
+        section.L_p.m_as("inch"),
+        section.L_r.m_as("inch")
+    )
+
+@_cache_on_section
+def _F3_properties(section) -> tuple[float, ...]:
+    """Return the values used by the scalar Section F3 kernel as floats in kip,
+    inch, and ksi. This adds the compression flange local buckling moment,
+    which only depends on the section, to the Section F2 values.
+
+    Parameters
+    ==========
+
+    section : aisc.WideFlange
+        Section to get the properties of"""
+    properties = _F2_properties(section)
+    F_y, E, S_x = properties[:3]
+    M_flb = kernels.sec_F3_2(F_y, E, S_x, properties[7], section.lamb_f,
+        section.lamb_w)
+    return (*properties, M_flb)
+
+@_cache_on_section
+def _F11_properties(section) -> tuple[float, ...]:
+    """Return the section properties used by the Section F11 kernel as floats
+    in kip, inch, and ksi
+
+    Parameters
+    ==========
+
+    section : aisc.Plate
+        Section to get the properties of"""
+    return (
+        section.F_y.m_as("ksi"),
+        section.E.m_as("ksi"),
+        section.Z_x.m_as("inch**3"),
+        section.S_x.m_as("inch**3"),
+        section.d.m_as("inch"),
+        section.t.m_as("inch")
+    )
+
+# Order of the section properties taken by the Section F2 array kernels
+_F2_names = ("F_y", "E", "Z_x", "S_x", "r_y", "r_ts", "J", "c", "h_o")
+
+def _F2_arrays(sections, names: tuple[str, ...]) -> list:
+    """Return the named Section F2 properties of a set of sections as float
+    arrays in kip, inch, and ksi, gathered from the shape class catalogs
+
+    Parameters
+    ==========
+
+    sections : Iterable[aisc.WideFlange]
+        Sections to get the properties of
+
+    names : tuple[str, ...]
+        Names of the properties to return"""
+    sections = list(sections)
+    if not sections:
+        raise ValueError("At least one section is required")
+    shape, material = type(sections[0]), sections[0].material
+    if all(type(section) is shape and section.material == material
+            for section in sections):
+        columns = shape.catalog(material)
+        index = shape.database.index.get_indexer(
+            [section.size for section in sections])
+        return [take(columns[name], index) for name in names]
+    rows = [
+        (type(section).catalog(section.material),
+         type(section).database.index.get_loc(section.size))
+        for section in sections
+    ]
+    return [array([columns[name][i] for columns, i in rows]) for name in names]
+
+def _batch_arrays(sections, names: tuple[str, ...], L_b: Length | NumericArray
+        ) -> tuple[list, float | NumericArray]:
+    """Return the named property arrays of a set of sections and the L_b
+    magnitude in inch for the batch functions. When L_b is an array the
+    properties are returned as columns so the kernels broadcast to a grid of
+    sections by lengths.
+
+    Parameters
+    ==========
+
+    sections : Iterable[aisc.WideFlange]
+        Sections to get the properties of
+
+    names : tuple[str, ...]
+        Names of the properties to return
+
+    L_b : Length | NumericArray
+        Compression flange unbraced length or lengths"""
+    properties = _F2_arrays(sections, names)
+    L_b = L_b.m_as("inch")
+    if ndim(L_b):
+        properties = [column[:, newaxis] for column in properties]
+    return properties, L_b
+
 def eq_F2_1(F_y: Stress, Z_x: SectionModulus, **string_options) -> Result[Moment]:
     """AISC 360-22 Equation F2-1
 
@@ -40,8 +187,11 @@ def eq_F2_1(F_y: Stress, Z_x: SectionModulus, **string_options) -> Result[Moment
 
     Z_x : SectionModulus
         Major axis plastic section modulus"""
-    M_p = (F_y*Z_x).to("kipft")
-    return fill_template(M_p, templates["eq_F2_1"], locals(), **string_options)
+    M_p = F_y.m_as("ksi")*Z_x.m_as("inch**3")/12*unit.kipft
+    if not string_requested(string_options):
+        return Result("", M_p)
+    return fill_template(M_p, _templates()["eq_F2_1"],
+        {"F_y": F_y, "Z_x": Z_x, "M_p": M_p}, **string_options)
 
 def eq_F2_2(C_b: float, M_p: Moment, F_y: Stress, S_x: SectionModulus,
         L_b: Length, L_p: Length, L_r: Length, **string_options) -> Result[Moment]:
@@ -70,8 +220,22 @@ def eq_F2_2(C_b: float, M_p: Moment, F_y: Stress, S_x: SectionModulus,
 
     L_r : Length
         Limiting length for elastic lateral-torsional buckling"""
-    M_ltb = (C_b*(M_p-(M_p-0.7*F_y*S_x)*(L_b-L_p)/(L_r-L_p))).to("kipft")
-    return fill_template(M_ltb, templates["eq_F2_2"], locals(), **string_options)
+    M_p_kipft = M_p.m_as("kipft")
+    L_p_ft = L_p.m_as("ft")
+    M_ltb = C_b*(M_p_kipft-(M_p_kipft-0.7*F_y.m_as("ksi")*S_x.m_as("inch**3")/12) \
+        *(L_b.m_as("ft")-L_p_ft)/(L_r.m_as("ft")-L_p_ft))*unit.kipft
+    if not string_requested(string_options):
+        return Result("", M_ltb)
+    return fill_template(M_ltb, _templates()["eq_F2_2"], {
+        "C_b": C_b,
+        "M_p": M_p,
+        "F_y": F_y,
+        "S_x": S_x,
+        "L_b": L_b,
+        "L_p": L_p,
+        "L_r": L_r,
+        "M_ltb": M_ltb
+    }, **string_options)
 
 def eq_F2_3(F_cr: Stress, S_x: SectionModulus, **string_options) -> Result[Moment]:
     """AISC 360-22 Equation F2-3
@@ -84,8 +248,11 @@ def eq_F2_3(F_cr: Stress, S_x: SectionModulus, **string_options) -> Result[Momen
 
     S_x : SectionModulus
         Major axis elastic section modulus"""
-    M_ltb = (F_cr*S_x).to("kipft")
-    return fill_template(M_ltb, templates["eq_F2_3"], locals(), **string_options)
+    M_ltb = F_cr.m_as("ksi")*S_x.m_as("inch**3")/12*unit.kipft
+    if not string_requested(string_options):
+        return Result("", M_ltb)
+    return fill_template(M_ltb, _templates()["eq_F2_3"],
+        {"F_cr": F_cr, "S_x": S_x, "M_ltb": M_ltb}, **string_options)
 
 def eq_F2_4(C_b: float, E: Stress, L_b: Length, r_ts: Length, J: TorsionalConstant,
         c: float, S_x: SectionModulus, h_o: Length, **string_options) -> Result[Stress]:
@@ -117,8 +284,22 @@ def eq_F2_4(C_b: float, E: Stress, L_b: Length, r_ts: Length, J: TorsionalConsta
 
     h_o : Length
         Distance between the flange centroids"""
-    F_cr = (C_b*E*pi**2/(L_b/r_ts)**2*sqrt(1+0.078*J*c/(S_x*h_o)*(L_b/r_ts)**2)).to("ksi")
-    return fill_template(F_cr, templates["eq_F2_4"], locals(), **string_options)
+    slenderness = (L_b.m_as("inch")/r_ts.m_as("inch"))**2
+    J_c = J.m_as("inch**4")*c/(S_x.m_as("inch**3")*h_o.m_as("inch"))
+    F_cr = C_b*E.m_as("ksi")*_pi_squared/slenderness*sqrt(1+0.078*J_c*slenderness)*unit.ksi
+    if not string_requested(string_options):
+        return Result("", F_cr)
+    return fill_template(F_cr, _templates()["eq_F2_4"], {
+        "C_b": C_b,
+        "E": E,
+        "L_b": L_b,
+        "r_ts": r_ts,
+        "J": J,
+        "c": c,
+        "S_x": S_x,
+        "h_o": h_o,
+        "F_cr": F_cr
+    }, **string_options)
 
 def eq_F2_5(r_y: Length, E: Stress, F_y: Stress, **string_options) -> Result[Length]:
     """AISC 360-22 Equation F2-5
@@ -134,8 +315,11 @@ def eq_F2_5(r_y: Length, E: Stress, F_y: Stress, **string_options) -> Result[Len
 
     F_y : Stress
         Steel yield stress"""
-    L_p = (1.76*r_y*sqrt(E/F_y)).to("ft")
-    return fill_template(L_p, templates["eq_F2_5"], locals(), **string_options)
+    L_p = 1.76*r_y.m_as("ft")*sqrt(E.m_as("ksi")/F_y.m_as("ksi"))*unit.ft
+    if not string_requested(string_options):
+        return Result("", L_p)
+    return fill_template(L_p, _templates()["eq_F2_5"],
+        {"r_y": r_y, "E": E, "F_y": F_y, "L_p": L_p}, **string_options)
 
 def eq_F2_6(r_ts: Length, E: Stress, F_y: Stress, J: TorsionalConstant,
         c: float, S_x: SectionModulus, h_o: Length, **string_options) -> Result[Length]:
@@ -164,9 +348,21 @@ def eq_F2_6(r_ts: Length, E: Stress, F_y: Stress, J: TorsionalConstant,
 
     h_o : Length
         Distance between the flange centroids"""
-    L_r = (1.95*r_ts*E/(0.7*F_y)*sqrt(J*c/(S_x*h_o) \
-        +sqrt((J*c/(S_x*h_o))**2+6.76*(0.7*F_y/E)**2))).to("ft")
-    return fill_template(L_r, templates["eq_F2_6"], locals(), **string_options)
+    F_y_E = 0.7*F_y.m_as("ksi")/E.m_as("ksi")
+    J_c = J.m_as("inch**4")*c/(S_x.m_as("inch**3")*h_o.m_as("inch"))
+    L_r = 1.95*r_ts.m_as("ft")/F_y_E*sqrt(J_c+sqrt(J_c**2+6.76*F_y_E**2))*unit.ft
+    if not string_requested(string_options):
+        return Result("", L_r)
+    return fill_template(L_r, _templates()["eq_F2_6"], {
+        "r_ts": r_ts,
+        "E": E,
+        "F_y": F_y,
+        "J": J,
+        "c": c,
+        "S_x": S_x,
+        "h_o": h_o,
+        "L_r": L_r
+    }, **string_options)
 
 def eq_F2_8b(h_o: Length, I_y: MomentOfInertia, C_w: WarpingConstant,
              **string_options) -> Result[float]:
@@ -183,9 +379,13 @@ def eq_F2_8b(h_o: Length, I_y: MomentOfInertia, C_w: WarpingConstant,
 
     C_w : WarpingConstant
         Warping constant"""
-    c = (h_o/2*sqrt(I_y/C_w)).to("dimensionless").magnitude
-    return fill_template(c, templates["eq_F2_8b"], locals(), **string_options)
+    c = h_o.m_as("inch")/2*sqrt(I_y.m_as("inch**4")/C_w.m_as("inch**6"))
+    if not string_requested(string_options):
+        return Result("", c)
+    return fill_template(c, _templates()["eq_F2_8b"],
+        {"h_o": h_o, "I_y": I_y, "C_w": C_w, "c": c}, **string_options)
 
+@cache_values
 def sec_F2_1(section, **string_options) -> Result[Moment]:
     """Calculate the major axis plastic moment capacity of an I section with a
     compact web according to AISC 360-22 Section F2.1
@@ -195,9 +395,13 @@ def sec_F2_1(section, **string_options) -> Result[Moment]:
 
     section : aisc.WideFlange
         Section to calculate the plastic moment capacity of"""
+    if not string_requested(string_options):
+        return Result("", section.M_p)
     M_p_str, M_p = eq_F2_1(section.F_y, section.Z_x, **string_options)
-    return fill_template(M_p, templates["sec_F2_1"], locals(), **string_options)
+    return fill_template(M_p, _templates()["sec_F2_1"],
+        {"M_p_str": M_p_str}, **string_options)
 
+@cache_values
 def sec_F2_2(section, L_b: Length, M_p: Moment, C_b: float, **string_options) -> Result[Moment]:
     """Calculate the major axis nominal moment capacity of an I section with a
     compact web based on the limit of lateral torsional buckling according to
@@ -217,28 +421,53 @@ def sec_F2_2(section, L_b: Length, M_p: Moment, C_b: float, **string_options) ->
 
     C_b : float
         Lateral-torsional buckling modification factor"""
+    if not string_requested(string_options):
+        F_y, E, S_x, r_ts, J, c, h_o, _, L_p, L_r = _F2_properties(section)
+        L_b = L_b.m_as("inch")
+        if L_b <= L_p:
+            return Result("", M_p)
+        M_ltb = kernels.sec_F2_2(F_y, E, S_x, r_ts, J, c, h_o, M_p.m_as("kipin"),
+            L_p, L_r, L_b, C_b)
+        return Result("", M_ltb/12*unit.kipft)
+
+    E, F_y, S_x, h_o = section.E, section.F_y, section.S_x, section.h_o
+    r_ts, J = section.r_ts, section.J
     if section.type == "W":
         c_str, c = Result("", 1)
     else:
-        c_str, c = eq_F2_8b(section.h_o, section.I_y, section.C_w, **string_options)
+        c_str, c = eq_F2_8b(h_o, section.I_y, section.C_w, **string_options)
 
-    L_p_str, L_p = eq_F2_5(section.r_y, section.E, section.F_y, **string_options)
-    L_r_str, L_r = eq_F2_6(section.r_ts, section.E, section.F_y, section.J, c,
-        section.S_x, section.h_o, **string_options)
+    L_p_str, L_p = eq_F2_5(section.r_y, E, F_y, **string_options)
+    L_r_str, L_r = eq_F2_6(r_ts, E, F_y, J, c, S_x, h_o, **string_options)
     if L_b <= L_p:
         M_ltb = M_p
-        template = templates["sec_F2_2_plastic"]
+        template = "sec_F2_2_plastic"
+        variables = {"L_b": L_b, "L_p": L_p, "L_p_str": L_p_str, "M_p": M_p, "M_ltb": M_ltb}
     elif L_b <= L_r:
-        M_ltb_str, M_ltb = eq_F2_2(C_b, M_p, section.F_y, section.S_x, L_b, L_p,
-            L_r, **string_options)
-        template = templates["sec_F2_2_inelastic"]
+        M_ltb_str, M_ltb = eq_F2_2(C_b, M_p, F_y, S_x, L_b, L_p, L_r, **string_options)
+        template = "sec_F2_2_inelastic"
+        variables = {
+            "L_b": L_b,
+            "L_p": L_p,
+            "L_p_str": L_p_str,
+            "L_r": L_r,
+            "L_r_str": L_r_str,
+            "M_ltb_str": M_ltb_str
+        }
     else:
-        F_cr_str, F_cr = eq_F2_4(C_b, section.E, L_b, section.r_ts, section.J, c,
-            section.S_x, section.h_o, **string_options)
-        M_ltb_str, M_ltb = eq_F2_3(F_cr, section.S_x, **string_options)
-        template = templates["sec_F2_2_elastic"]
-    return fill_template(M_ltb, template, locals(), **string_options)
-
+        F_cr_str, F_cr = eq_F2_4(C_b, E, L_b, r_ts, J, c, S_x, h_o, **string_options)
+        M_ltb_str, M_ltb = eq_F2_3(F_cr, S_x, **string_options)
+        template = "sec_F2_2_elastic"
+        variables = {
+            "L_b": L_b,
+            "L_r": L_r,
+            "L_r_str": L_r_str,
+            "F_cr_str": F_cr_str,
+            "M_ltb_str": M_ltb_str
+        }
+    return fill_template(M_ltb, _templates()[template], variables, **string_options)
+
+@cache_values
 def sec_F2(section, L_b: Length, C_b: float, **string_options) -> Result[Moment]:
     """Calculate the major axis nominal moment capacity of a compact I section
     according to AISC 360-22 Section F2.
@@ -254,10 +483,67 @@ def sec_F2(section, L_b: Length, C_b: float, **string_options) -> Result[Moment]
 
     C_b : float
         Lateral-torsional buckling modification factor"""
+    if not string_requested(string_options):
+        properties = _F2_properties(section)
+        L_b = L_b.m_as("inch")
+        if L_b <= properties[8]:
+            return Result("", section.M_p)
+        M_n = kernels.sec_F2(*properties, L_b, C_b)
+        return Result("", M_n/12*unit.kipft)
+
     M_p_str, M_p = sec_F2_1(section, **string_options)
     M_ltb_str, M_ltb = sec_F2_2(section, L_b, M_p, C_b, **string_options)
     M_n = min(M_p, M_ltb)
-    return fill_template(M_n, templates["sec_F2"], locals(), **string_options)
+    return fill_template(M_n, _templates()["sec_F2"], {
+        "M_p_str": M_p_str,
+        "M_ltb_str": M_ltb_str,
+        "M_p": M_p,
+        "M_ltb": M_ltb,
+        "M_n": M_n
+    }, **string_options)
+
+def sec_F2_batch(sections, L_b: Length | NumericArray, C_b: float) -> NumericArray:
+    """Calculate the major axis nominal moment capacity of a set of compact I
+    sections according to AISC 360-22 Section F2. The calculation is
+    vectorized over the sections and no strings are produced. If L_b is an
+    array the result has one row per section and one column per length.
+    Section properties are read from the shape database by size and
+    material, so changes made to the section instances are not used.
+
+    Parameters
+    ==========
+
+    sections : Iterable[aisc.WideFlange]
+        Sections to calculate the nominal moment capacity of
+
+    L_b : Length | NumericArray
+        Compression flange unbraced length or lengths
+
+    C_b : float
+        Lateral-torsional buckling modification factor"""
+    properties, L_b = _batch_arrays(sections, _F2_names, L_b)
+    M_n = kernels.sec_F2_array(*properties, L_b, C_b)
+    return M_n/12*unit.kipft
+
+def sec_F2_sweep(section, L_b: NumericArray, C_b: float | NumericArray) -> NumericArray:
+    """Calculate the major axis nominal moment capacity of a compact I section
+    according to AISC 360-22 Section F2 for an array of unbraced lengths. The
+    calculation is vectorized over L_b and C_b and no strings are produced.
+
+    Parameters
+    ==========
+
+    section : aisc.WideFlange
+        Section to calculate the nominal moment capacity of
+
+    L_b : NumericArray
+        Compression flange unbraced lengths
+
+    C_b : float | NumericArray
+        Lateral-torsional buckling modification factors"""
+    properties = _F2_properties(section)
+    M_ltb = kernels.sec_F2_2_array(*properties, L_b.m_as("inch"), C_b)
+    return minimum(properties[7], M_ltb)/12*unit.kipft
 
 def eq_F3_1(M_p: Moment, F_y: Stress, S_x: SectionModulus, lamb_f: float,
         lamb_pf: float, lamb_rf: float, **string_options) -> Result[Moment]:
@@ -283,8 +569,20 @@ def eq_F3_1(M_p: Moment, F_y: Stress, S_x: SectionModulus, lamb_f: float,
 
     lamb_rf : float
         Noncompact section flange slenderness limit for flexure"""
-    M_flb = (M_p-(M_p-0.7*F_y*S_x)*(lamb_f-lamb_pf)/(lamb_rf-lamb_pf)).to("kipft")
-    return fill_template(M_flb, templates["eq_F3_1"], locals(), **string_options)
+    M_p_kipft = M_p.m_as("kipft")
+    M_flb = (M_p_kipft-(M_p_kipft-0.7*F_y.m_as("ksi")*S_x.m_as("inch**3")/12) \
+        *(lamb_f-lamb_pf)/(lamb_rf-lamb_pf))*unit.kipft
+    if not string_requested(string_options):
+        return Result("", M_flb)
+    return fill_template(M_flb, _templates()["eq_F3_1"], {
+        "M_p": M_p,
+        "F_y": F_y,
+        "S_x": S_x,
+        "lamb_f": lamb_f,
+        "lamb_pf": lamb_pf,
+        "lamb_rf": lamb_rf,
+        "M_flb": M_flb
+    }, **string_options)
 
 def eq_F3_2(E: Stress, k_c: float, S_x: SectionModulus, lamb_f: float,
         **string_options) -> Result[Moment]:
@@ -304,8 +602,16 @@ def eq_F3_2(E: Stress, k_c: float, S_x: SectionModulus, lamb_f: float,
 
     lamb_f : float
         Section flange slenderness for flexure"""
-    M_flb = (0.9*E*k_c*S_x/lamb_f**2).to("kipft")
-    return fill_template(M_flb, templates["eq_F3_2"], locals(), **string_options)
+    M_flb = 0.9*E.m_as("ksi")*k_c*S_x.m_as("inch**3")/lamb_f**2/12*unit.kipft
+    if not string_requested(string_options):
+        return Result("", M_flb)
+    return fill_template(M_flb, _templates()["eq_F3_2"], {
+        "E": E,
+        "k_c": k_c,
+        "S_x": S_x,
+        "lamb_f": lamb_f,
+        "M_flb": M_flb
+    }, **string_options)
 
 def eq_F3_2a(lamb_w: float, **string_options) -> Result[float]:
     """Calculate k_c according to AISC 360-22 Section F3.2b
@@ -315,9 +621,14 @@ def eq_F3_2a(lamb_w: float, **string_options) -> Result[float]:
 
     lamb_w : float
         Section web slenderness for flexure"""
-    k_c = min(max(0.35, 4/sqrt(lamb_w)), 0.76)
-    return fill_template(k_c, templates["eq_F3_2a"], locals(), **string_options)
-
+    k_c = 4/sqrt(lamb_w)
+    k_c = 0.35 if k_c < 0.35 else 0.76 if k_c > 0.76 else k_c
+    if not string_requested(string_options):
+        return Result("", k_c)
+    return fill_template(k_c, _templates()["eq_F3_2a"],
+        {"lamb_w": lamb_w, "k_c": k_c}, **string_options)
+
+@cache_values
 def sec_F3_2(section, M_p: Moment, **string_options) -> Result[Moment]:
     """Calculate the major axis nominal moment of an I section with a compact web
     based on the limit of compression flange local buckling according to
@@ -331,19 +642,38 @@ def sec_F3_2(section, M_p: Moment, **string_options) -> Result[Moment]:
 
     M_p : Moment
         Major axis nominal plastic moment capacity of the section"""
-    lamb_f = section.lamb_f
-    lamb_pf_str, lamb_pf = chapter_B.table_B4_1b_10_lamb_p(section.E, section.F_y, **string_options)
-    lamb_rf_str, lamb_rf = chapter_B.table_B4_1b_10_lamb_r(section.E, section.F_y, **string_options)
+    E, F_y, S_x, lamb_f = section.E, section.F_y, section.S_x, section.lamb_f
+    if not string_requested(string_options):
+        lamb_pf, lamb_rf = section.lamb_pf, section.lamb_rf
+    else:
+        lamb_pf_str, lamb_pf = chapter_B.table_B4_1b_10_lamb_p(E, F_y, **string_options)
+        lamb_rf_str, lamb_rf = chapter_B.table_B4_1b_10_lamb_r(E, F_y, **string_options)
     if lamb_f < lamb_rf:
-        M_flb_str, M_flb = eq_F3_1(M_p, section.F_y, section.S_x, section.lamb_f,
-            lamb_pf, lamb_rf, **string_options)
-        template = templates["sec_F3_2_noncompact"]
+        M_flb_str, M_flb = eq_F3_1(M_p, F_y, S_x, lamb_f, lamb_pf, lamb_rf,
+            **string_options)
+        template = "sec_F3_2_noncompact"
+    else:
+        if not string_requested(string_options):
+            k_c = section.k_c
+        else:
+            k_c_str, k_c = eq_F3_2a(section.lamb_w, **string_options)
+        M_flb_str, M_flb = eq_F3_2(E, k_c, S_x, lamb_f, **string_options)
+        template = "sec_F3_2_slender"
+    if not string_requested(string_options):
+        return Result("", M_flb)
+    variables = {
+        "lamb_f": lamb_f,
+        "lamb_rf": lamb_rf,
+        "lamb_rf_str": lamb_rf_str,
+        "M_flb_str": M_flb_str
+    }
+    if template == "sec_F3_2_noncompact":
+        variables.update({"lamb_pf": lamb_pf, "lamb_pf_str": lamb_pf_str})
     else:
-        k_c_str, k_c = eq_F3_2a(section.lamb_w, **string_options)
-        M_flb_str, M_flb = eq_F3_2(section.E, k_c, section.S_x, section.lamb_f, **string_options)
-        template = templates["sec_F3_2_slender"]
-    return fill_template(M_flb, template, locals(), **string_options)
+        variables["k_c_str"] = k_c_str
+    return fill_template(M_flb, _templates()[template], variables, **string_options)
 
+@cache_values
 def sec_F3(section, L_b: Length, C_b: float, **string_options) -> Result[Moment]:
     """Calculate the major axis nominal moment capacity of a compact I section
     according to AISC 360-22 Section F3.
@@ -359,11 +689,120 @@ def sec_F3(section, L_b: Length, C_b: float, **string_options) -> Result[Moment]
 
     C_b : float
         Lateral-torsional buckling modification factor"""
+    if not string_requested(string_options):
+        M_n = kernels.sec_F3(*_F3_properties(section), L_b.m_as("inch"), C_b)
+        return Result("", M_n/12*unit.kipft)
+
     M_p_str, M_p = sec_F2_1(section, **string_options)
     M_ltb_str, M_ltb = sec_F2_2(section, L_b, M_p, C_b, **string_options)
     M_flb_str, M_flb = sec_F3_2(section, M_p, **string_options)
     M_n = min(M_ltb, M_flb)
-    return fill_template(M_n, templates["sec_F3"], locals(), **string_options)
+    return fill_template(M_n, _templates()["sec_F3"], {
+        "M_p_str": M_p_str,
+        "M_ltb_str": M_ltb_str,
+        "M_flb_str": M_flb_str,
+        "M_ltb": M_ltb,
+        "M_flb": M_flb,
+        "M_n": M_n
+    }, **string_options)
+
+def sec_F2_F3(section, L_b: Length, C_b: float) -> tuple[Moment, Moment]:
+    """Calculate the major axis nominal moment capacity of an I section with a
+    compact web according to both AISC 360-22 Sections F2 and F3. M_p and the
+    lateral-torsional buckling moment are calculated once and shared by both
+    results. No strings are produced.
+
+    Parameters
+    ==========
+
+    section : aisc.WideFlange
+        Section to calculate the nominal moment capacities of
+
+    L_b : Length
+        Compression flange unbraced length
+
+    C_b : float
+        Lateral-torsional buckling modification factor"""
+    *properties, M_flb = _F3_properties(section)
+    M_p = properties[7]
+    M_ltb = kernels.sec_F2_2(*properties, L_b.m_as("inch"), C_b)
+    return min(M_p, M_ltb)/12*unit.kipft, min(M_ltb, M_flb)/12*unit.kipft
+
+def sec_F2_F3_catalog(shape, L_b: Length | NumericArray, C_b: float,
+        material: Optional[str] = None) -> NumericArray:
+    """Calculate the major axis nominal moment capacity of every shape in an I
+    shape database according to AISC 360-22 Section F2 or F3, depending on
+    flange compactness. The calculation is vectorized over the whole database
+    using the shape catalog and no strings are produced. Results are in the
+    order of the database index and shapes with noncompact or slender webs are
+    returned as nan. If L_b is an array the result has one row per shape and
+    one column per length.
+
+    Parameters
+    ==========
+
+    shape : type[aisc.WideFlange]
+        Shape class to evaluate the database of
+
+    L_b : Length | NumericArray
+        Compression flange unbraced length or lengths
+
+    C_b : float
+        Lateral-torsional buckling modification factor
+
+    material : str
+        Name to use when looking up steel properties"""
+    columns = shape.catalog(material)
+    properties = [columns[name] for name in _F2_names+("lamb_f", "lamb_w")]
+    L_b = L_b.m_as("inch")
+    if ndim(L_b):
+        properties = [column[:, newaxis] for column in properties]
+    M_n = kernels.sec_F2_F3_array(*properties, L_b, C_b)
+    return M_n/12*unit.kipft
+
+def sec_F3_batch(sections, L_b: Length | NumericArray, C_b: float) -> NumericArray:
+    """Calculate the major axis nominal moment capacity of a set of I sections
+    with compact webs according to AISC 360-22 Section F3. The calculation is
+    vectorized over the sections and no strings are produced. If L_b is an
+    array the result has one row per section and one column per length.
+    Section properties are read from the shape database by size and
+    material, so changes made to the section instances are not used.
+
+    Parameters
+    ==========
+
+    sections : Iterable[aisc.WideFlange]
+        Sections to calculate the nominal moment capacity of
+
+    L_b : Length | NumericArray
+        Compression flange unbraced length or lengths
+
+    C_b : float
+        Lateral-torsional buckling modification factor"""
+    properties, L_b = _batch_arrays(sections, _F2_names+("lamb_f", "lamb_w"), L_b)
+    M_n = kernels.sec_F3_array(*properties, L_b, C_b)
+    return M_n/12*unit.kipft
+
+def sec_F3_sweep(section, L_b: NumericArray, C_b: float | NumericArray) -> NumericArray:
+    """Calculate the major axis nominal moment capacity of an I section with a
+    compact web according to AISC 360-22 Section F3 for an array of unbraced
+    lengths. The calculation is vectorized over L_b and C_b and no strings are
+    produced.
+
+    Parameters
+    ==========
+
+    section : aisc.WideFlange
+        Section to calculate the nominal moment capacity of
+
+    L_b : NumericArray
+        Compression flange unbraced lengths
+
+    C_b : float | NumericArray
+        Lateral-torsional buckling modification factors"""
+    properties = _F3_properties(section)
+    M_ltb = kernels.sec_F2_2_array(*properties[:10], L_b.m_as("inch"), C_b)
+    return minimum(M_ltb, properties[10])/12*unit.kipft
 
 def eq_F11_1(F_y: Stress, Z_x: SectionModulus, S_x: SectionModulus,
         **string_options) -> Result[Moment]:
@@ -380,8 +819,11 @@ def eq_F11_1(F_y: Stress, Z_x: SectionModulus, S_x: SectionModulus,
 
     S : SectionModulus
         Major axis elastic section modulus"""
-    M_p = min(F_y*Z_x, 1.5*F_y*S_x).to("kipft")
-    return fill_template(M_p, templates["eq_F11_1"], locals(), **string_options)
+    M_p = F_y.m_as("ksi")*min(Z_x.m_as("inch**3"), 1.5*S_x.m_as("inch**3"))/12*unit.kipft
+    if not string_requested(string_options):
+        return Result("", M_p)
+    return fill_template(M_p, _templates()["eq_F11_1"],
+        {"F_y": F_y, "Z_x": Z_x, "S_x": S_x, "M_p": M_p}, **string_options)
 
 def eq_F11_3(C_b: float, L_b: Length, d: Length, t: Length, F_y: Stress,
         E: Stress, S_x: SectionModulus, **string_options) -> Result[Moment]:
@@ -410,8 +852,21 @@ def eq_F11_3(C_b: float, L_b: Length, d: Length, t: Length, F_y: Stress,
 
     S_x : Section modulus
         Major axis elastic section modulus"""
-    M_ltb = (C_b*(1.52-0.274*(L_b*d*F_y)/(E*t**2))*F_y*S_x).to("kipft")
-    return fill_template(M_ltb, templates["eq_F11_3"], locals(), **string_options)
+    F_y_ksi = F_y.m_as("ksi")
+    M_ltb = C_b*(1.52-0.274*(L_b.m_as("inch")*d.m_as("inch")*F_y_ksi) \
+        /(E.m_as("ksi")*t.m_as("inch")**2))*F_y_ksi*S_x.m_as("inch**3")/12*unit.kipft
+    if not string_requested(string_options):
+        return Result("", M_ltb)
+    return fill_template(M_ltb, _templates()["eq_F11_3"], {
+        "C_b": C_b,
+        "L_b": L_b,
+        "d": d,
+        "t": t,
+        "F_y": F_y,
+        "E": E,
+        "S_x": S_x,
+        "M_ltb": M_ltb
+    }, **string_options)
 
 def eq_F11_4(F_cr: Stress, S_x: SectionModulus, **string_options) -> Result[Moment]:
     """AISC 360-22 Equation F11-4
@@ -424,8 +879,11 @@ def eq_F11_4(F_cr: Stress, S_x: SectionModulus, **string_options) -> Result[Mome
 
     S_x : SectionModulus
         Major axis elastic section modulus"""
-    M_ltb = (F_cr*S_x).to("kipft")
-    return fill_template(M_ltb, templates["eq_F11_4"], locals(), **string_options)
+    M_ltb = F_cr.m_as("ksi")*S_x.m_as("inch**3")/12*unit.kipft
+    if not string_requested(string_options):
+        return Result("", M_ltb)
+    return fill_template(M_ltb, _templates()["eq_F11_4"],
+        {"F_cr": F_cr, "S_x": S_x, "M_ltb": M_ltb}, **string_options)
 
 def eq_F11_5(E: Stress, C_b: float, L_b: Length, d: Length, t: Length,
         **string_options) -> Result[Stress]:
@@ -448,8 +906,17 @@ def eq_F11_5(E: Stress, C_b: float, L_b: Length, d: Length, t: Length,
 
     t : Length
         Section width"""
-    F_cr = (1.9*E*C_b)/(L_b*d/t**2)
-    return fill_template(F_cr, templates["eq_F11_5"], locals(), **string_options)
+    F_cr = 1.9*E.m_as("ksi")*C_b/(L_b.m_as("inch")*d.m_as("inch")/t.m_as("inch")**2)*unit.ksi
+    if not string_requested(string_options):
+        return Result("", F_cr)
+    return fill_template(F_cr, _templates()["eq_F11_5"], {
+        "E": E,
+        "C_b": C_b,
+        "L_b": L_b,
+        "d": d,
+        "t": t,
+        "F_cr": F_cr
+    }, **string_options)
 
 def sec_F11_1(section, **string_options) -> Result[Moment]:
     """Calculate the plastic moment capacity of a rectangular bar according to
@@ -461,7 +928,10 @@ def sec_F11_1(section, **string_options) -> Result[Moment]:
     section : aisc.Plate
         Section to calculate the plastic moment capacity of"""
     M_p_str, M_p = eq_F11_1(section.F_y, section.Z_x, section.S_x, **string_options)
-    return fill_template(M_p, templates["sec_F11_1_rect"], locals(), **string_options)
+    if not string_requested(string_options):
+        return Result("", M_p)
+    return fill_template(M_p, _templates()["sec_F11_1_rect"],
+        {"M_p_str": M_p_str}, **string_options)
 
 def sec_F11_2(section, L_b: Length, M_p: Moment, C_b: float, **string_options) -> Result[Moment]:
     """Calculate the major axis nominal moment capacity of a rectangular bar
@@ -484,23 +954,32 @@ def sec_F11_2(section, L_b: Length, M_p: Moment, C_b: float, **string_options) -
         Lateral-torsional buckling modification factor"""
     E = section.E
     F_y = section.F_y
+    S_x = section.S_x
     d = section.d
     t = section.t
 
-    lamb_p = 0.08*E/F_y
-    lamb_r = 1.9*E/F_y
-    lamb = L_b*d/t**2
-    if lamb <= lamb_p:
+    E_F_y = E.m_as("ksi")/F_y.m_as("ksi")
+    lamb = L_b.m_as("inch")*d.m_as("inch")/t.m_as("inch")**2
+    if lamb <= 0.08*E_F_y:
         M_ltb = M_p
-        template = templates["sec_F11_2_plastic"]
-    elif lamb <= lamb_r:
-        M_ltb_str, M_ltb = eq_F11_3(C_b, L_b, d, t, F_y, E, section.S_x, **string_options)
-        template = templates["sec_F11_2_inelastic"]
+        template = "sec_F11_2_plastic"
+    elif lamb <= 1.9*E_F_y:
+        M_ltb_str, M_ltb = eq_F11_3(C_b, L_b, d, t, F_y, E, S_x, **string_options)
+        template = "sec_F11_2_inelastic"
     else:
         F_cr_str, F_cr = eq_F11_5(E, C_b, L_b, d, t, **string_options)
-        M_ltb_str, M_ltb = eq_F11_4(F_cr, section.S_x, **string_options)
-        template = templates["sec_F11_2_elastic"]
-    return fill_template(M_ltb, template, locals(), **string_options)
+        M_ltb_str, M_ltb = eq_F11_4(F_cr, S_x, **string_options)
+        template = "sec_F11_2_elastic"
+    if not string_requested(string_options):
+        return Result("", M_ltb)
+    variables = {"E": E, "F_y": F_y, "L_b": L_b, "d": d, "t": t}
+    if template == "sec_F11_2_plastic":
+        variables.update({"M_p": M_p, "M_ltb": M_ltb})
+    else:
+        variables["M_ltb_str"] = M_ltb_str
+        if template == "sec_F11_2_elastic":
+            variables["F_cr_str"] = F_cr_str
+    return fill_template(M_ltb, _templates()[template], variables, **string_options)
 
 def sec_F11(section, L_b: Length, C_b: float, **string_options) -> Result[Moment]:
     """Calculate the moment capacity of a rectangular bar according to
@@ -517,8 +996,61 @@ def sec_F11(section, L_b: Length, C_b: float, **string_options) -> Result[Moment
 
     C_b : float
         Lateral-torsional buckling modification factor"""
+    if not string_requested(string_options):
+        M_n = kernels.sec_F11(*_F11_properties(section), L_b.m_as("inch"), C_b)
+        return Result("", M_n/12*unit.kipft)
+
     M_p_str, M_p = sec_F11_1(section, **string_options)
     M_ltb_str, M_ltb = sec_F11_2(section, L_b, M_p, C_b, **string_options)
     M_n = min(M_p, M_ltb)
-    return fill_template(M_n, templates["sec_F11"], locals(), **string_options)
+    return fill_template(M_n, _templates()["sec_F11"], {
+        "M_p_str": M_p_str,
+        "M_ltb_str": M_ltb_str,
+        "M_p": M_p,
+        "M_ltb": M_ltb,
+        "M_n": M_n
+    }, **string_options)
+
+def sec_F11_batch(plates: Mapping[str, ndarray], L_b: Length | NumericArray,
+        C_b: float) -> NumericArray:
+    """Calculate the moment capacity of a set of rectangular bars according to
+    AISC 360-22 Section F11. The calculation is vectorized over the plates and
+    no strings are produced. If L_b is an array the result has one row per
+    plate and one column per length.
+
+    Parameters
+    ==========
+
+    plates : Mapping[str, ndarray]
+        Plate properties from aisc.Plate.from_arrays
+
+    L_b : Length | NumericArray
+        Compression side unbraced length or lengths
+
+    C_b : float
+        Lateral-torsional buckling modification factor"""
+    properties = [plates[name] for name in ("F_y", "E", "Z_x", "S_x", "d", "t")]
+    L_b = L_b.m_as("inch")
+    if ndim(L_b):
+        properties = [column[..., newaxis] for column in properties]
+    M_n = kernels.sec_F11_array(*properties, L_b, C_b)
+    return M_n/12*unit.kipft
+
+def sec_F11_sweep(section, L_b: NumericArray, C_b: float | NumericArray) -> NumericArray:
+    """Calculate the moment capacity of a rectangular bar according to
+    AISC 360-22 Section F11 for an array of unbraced lengths. The calculation
+    is vectorized over L_b and C_b and no strings are produced.
+
+    Parameters
+    ==========
+
+    section : aisc.Plate
+        Section to calculate the nominal moment capacity of
+
+    L_b : NumericArray
+        Compression side unbraced lengths
 
+    C_b : float | NumericArray
+        Lateral-torsional buckling modification factors"""
+    M_n = kernels.sec_F11_array(*_F11_properties(section), L_b.m_as("inch"), C_b)
+    return M_n/12*unit.kipft
@@ -13,25 +13,47 @@
 # limitations under the License.
 
 
+from collections.abc import Mapping
+from functools import cache, cached_property, lru_cache
 import importlib.resources
 import json
+from types import MappingProxyType
 from typing import Optional
 
-from numpy import sqrt
+from numpy import array, broadcast_arrays, full, ndarray, sqrt, where
 
 from structuraltools.aisc import chapter_B, chapter_E, chapter_F
-from structuraltools.unit import unit, Force, Length, Moment
-from structuraltools.utils import fill_template, read_data_table, Result
+from structuraltools.unit import unit, Force, Length, Moment, NumericArray
+from structuraltools.utils import fill_template, read_data_table, Result, string_requested
 
 
 resources = importlib.resources.files("structuraltools.aisc.resources")
 materials = read_data_table(resources.joinpath("steel_materials.csv"))
+# Material rows as plain dicts so instances do not index the table
+material_rows = materials.to_dict(orient="index")
 with open(resources.joinpath("sections_templates_processed.json")) as file:
     templates = json.load(file)
 
 
 class Section:
     """Base class for AISC steel shapes"""
+    @classmethod
+    @cache
+    def rows(cls) -> dict[str, dict[str, any]]:
+        """Return the database as a dict of property dicts keyed by size. The
+        rows are built once per class and shared, so they should not be
+        modified."""
+        return cls.database.to_dict(orient="index")
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def get(cls, *args, **kwargs):
+        """Return a shared instance created with the given arguments. Repeated
+        calls with the same arguments return the same instance, so cached
+        properties and results are reused. The instances are shared, so they
+        should not be modified."""
+        return cls(*args, **kwargs)
+
     def __init__(self, size: str, material: Optional[str] = None):
         """Create an instance from the specified database
 
@@ -44,14 +66,156 @@ class Section:
         material : str
             Name to use when looking up steel properties"""
         self.size = size
-        properties = self.database.loc[size, :].to_dict()
+        properties = self.rows()[size]
         if not material:
             material = self.default_material
+        self._load_rows(properties, material)
+
+    def _load_rows(self, properties: dict[str, any], material: str) -> None:
+        """Set the material and copy the shape properties and material
+        properties into the instance. The database columns never shadow
+        properties with setters, so the rows are copied straight into the
+        instance dict.
+
+        Parameters
+        ==========
+
+        properties : dict[str, any]
+            Shape properties from the database
+
+        material : str
+            Name to use when looking up steel properties"""
         self.material = material
-        material = materials.loc[material, :].to_dict()
-        properties.update(material)
-        for attribute, value in properties.items():
-            setattr(self, attribute, value)
+        self.__dict__.update(properties)
+        self.__dict__.update(material_rows[material])
+
+    @classmethod
+    @cache
+    def cached_properties(cls) -> tuple[str, ...]:
+        """Return the names of the cached properties of the class"""
+        return tuple(name for base in cls.__mro__
+            for name, value in vars(base).items()
+            if isinstance(value, cached_property))
+
+    def __setattr__(self, name: str, value: any) -> None:
+        """Set an attribute and discard the cached properties and results
+        calculated from the previous section properties"""
+        super().__setattr__(name, value)
+        self.__dict__.pop("_result_cache", None)
+        for cached in self.cached_properties():
+            self.__dict__.pop(cached, None)
+
+    @property
+    def result_cache(self) -> dict:
+        """Results of calculations on this section cached by
+        utils.cache_values. The cache is released with the section and cleared
+        whenever an attribute of the section is set."""
+        return self.__dict__.setdefault("_result_cache", {})
+
+
+def _magnitude(value, units: Optional[str]) -> float:
+    """Return the magnitude of a database value in the given units. Missing
+    values are returned as nan."""
+    if units is None or not hasattr(value, "m_as"):
+        return float(value)
+    return value.m_as(units)
+
+
+class _F2Section(Section):
+    """Base class for AISC steel shapes with major axis lateral-torsional
+    buckling properties calculated according to AISC 360-22 Section F2. The
+    properties only depend on the shape and material, so they are calculated
+    once and cached on the instance until one of its attributes is set."""
+    # Units the columns returned by catalog are stored in
+    catalog_units = MappingProxyType({
+        "Z_x": "inch**3",
+        "S_x": "inch**3",
+        "r_y": "inch",
+        "r_ts": "inch",
+        "J": "inch**4",
+        "h_o": "inch",
+        "I_y": "inch**4",
+        "C_w": "inch**6",
+        "lamb_f": None,
+        "lamb_w": None
+    })
+
+    @classmethod
+    @cache
+    def catalog(cls, material: Optional[str] = None) -> Mapping[str, ndarray]:
+        """Return the Section F2 properties of every shape in the database as
+        float arrays in kip, inch, and ksi. The arrays are in the same order as
+        the database index and are built once per material. The result is
+        shared between callers, so the mapping and arrays are read-only.
+
+        Parameters
+        ==========
+
+        material : str
+            Name to use when looking up steel properties"""
+        if not material:
+            material = cls.default_material
+        columns = {
+            name: array([_magnitude(value, units) for value in cls.database[name]])
+            for name, units in cls.catalog_units.items()
+        }
+        is_W = (cls.database["type"] == "W").to_numpy()
+        columns["c"] = where(is_W, 1.0,
+            columns["h_o"]/2*sqrt(columns["I_y"]/columns["C_w"]))
+        for name in ("F_y", "E"):
+            value = material_rows[material][name].m_as("ksi")
+            columns[name] = full(len(cls.database), value, dtype=float)
+        for column in columns.values():
+            column.flags.writeable = False
+        return MappingProxyType(columns)
+
+    @cached_property
+    def M_p(self) -> Moment:
+        """Major axis plastic moment capacity from AISC 360-22 Equation F2-1"""
+        return chapter_F.eq_F2_1(self.F_y, self.Z_x, return_string=False).value
+
+    @cached_property
+    def c(self) -> float:
+        """Modification coefficient from AISC 360-22 Equation F2-8a or F2-8b"""
+        if self.type == "W":
+            return 1
+        return chapter_F.eq_F2_8b(self.h_o, self.I_y, self.C_w, return_string=False).value
+
+    @cached_property
+    def L_p(self) -> Length:
+        """Limiting length for inelastic lateral-torsional buckling from
+        AISC 360-22 Equation F2-5"""
+        return chapter_F.eq_F2_5(self.r_y, self.E, self.F_y, return_string=False).value
+
+    @cached_property
+    def lamb_pf(self) -> float:
+        """Flange compact limiting slenderness from AISC 360-22 Table B4.1b
+        case 10"""
+        return chapter_B.table_B4_1b_10_lamb_p(self.E, self.F_y, return_string=False).value
+
+    @cached_property
+    def lamb_rf(self) -> float:
+        """Flange noncompact limiting slenderness from AISC 360-22 Table B4.1b
+        case 10"""
+        return chapter_B.table_B4_1b_10_lamb_r(self.E, self.F_y, return_string=False).value
+
+    @cached_property
+    def lamb_pw(self) -> float:
+        """Web compact limiting slenderness from AISC 360-22 Table B4.1b case
+        15"""
+        return chapter_B.table_B4_1b_15_lamb_p(self.E, self.F_y, return_string=False).value
+
+    @cached_property
+    def k_c(self) -> float:
+        """Slender flange coefficient from AISC 360-22 Section F3.2b"""
+        return chapter_F.eq_F3_2a(self.lamb_w, return_string=False).value
+
+    @cached_property
+    def L_r(self) -> Length:
+        """Limiting length for elastic lateral-torsional buckling from
+        AISC 360-22 Equation F2-6"""
+        return chapter_F.eq_F2_6(self.r_ts, self.E, self.F_y, self.J, self.c,
+            self.S_x, self.h_o, return_string=False).value
 
 
 class Angle(Section):
@@ -60,7 +224,7 @@ class Angle(Section):
     default_material = "A572Gr50"
 
 
-class Channel(Section):
+class Channel(_F2Section):
     """Class to represent channel shapes"""
     database = read_data_table(resources.joinpath("Channel.csv"))
     default_material = "A992"
@@ -88,22 +252,64 @@ class Plate(Section):
         material : str
             Material to use for the member"""
         self.size = f"Plate {d}X{t}"
-        self.d = d.to("inch")
-        self.t = t.to("inch")
-        self.A = (self.d*self.t).to("inch**2")
-        self.S_x = (self.t*self.d**2/6).to("inch**3")
-        self.I_x = (self.t*self.d**3/12).to("inch**4")
-        self.r_x = (sqrt(self.I_x/self.A)).to("inch")
-        self.Z_x = (self.t*self.d**2/4).to("inch**3")
-        self.S_y = (self.d*self.t**2/6).to("inch**3")
-        self.I_y = (self.d*self.t**3/12).to("inch**4")
-        self.r_y = (sqrt(self.I_y/self.A)).to("inch")
-        self.Z_y = (self.d*self.t**2/4).to("inch**3")
+        d = d.m_as("inch")
+        t = t.m_as("inch")
+        A = d*t
+        I_x = t*d**3/12
+        I_y = d*t**3/12
+        self.d = d*unit.inch
+        self.t = t*unit.inch
+        self.A = A*unit.inch**2
+        self.S_x = t*d**2/6*unit.inch**3
+        self.I_x = I_x*unit.inch**4
+        self.r_x = (I_x/A)**0.5*unit.inch
+        self.Z_x = t*d**2/4*unit.inch**3
+        self.S_y = d*t**2/6*unit.inch**3
+        self.I_y = I_y*unit.inch**4
+        self.r_y = (I_y/A)**0.5*unit.inch
+        self.Z_y = d*t**2/4*unit.inch**3
+
+        self._load_rows({}, material)
+
+    @classmethod
+    def from_arrays(cls, d: NumericArray, t: NumericArray,
+            material: str = "A572Gr50") -> Mapping[str, ndarray]:
+        """Return the section properties of a set of plates as float arrays in
+        kip, inch, and ksi. The arrays are keyed by the Plate attribute names
+        and can be passed to chapter_F.sec_F11_batch.
 
-        self.material = material
-        material = materials.loc[material, :].to_dict()
-        for attribute, value in material.items():
-            setattr(self, attribute, value)
+        Parameters
+        ==========
+
+        d : NumericArray
+            Plate widths
+
+        t : NumericArray
+            Plate thicknesses
+
+        material : str
+            Material to use for the members"""
+        d, t = broadcast_arrays(d.m_as("inch"), t.m_as("inch"))
+        A = d*t
+        I_x = t*d**3/12
+        I_y = d*t**3/12
+        columns = {
+            "d": d,
+            "t": t,
+            "A": A,
+            "S_x": t*d**2/6,
+            "I_x": I_x,
+            "r_x": sqrt(I_x/A),
+            "Z_x": t*d**2/4,
+            "S_y": d*t**2/6,
+            "I_y": I_y,
+            "r_y": sqrt(I_y/A),
+            "Z_y": d*t**2/4
+        }
+        for name in ("F_y", "E"):
+            value = material_rows[material][name].m_as("ksi")
+            columns[name] = full(d.shape, value, dtype=float)
+        return MappingProxyType(columns)
 
     def compression_capacity(self, L_c: Length, axis: str = "y",
             **string_options) -> Result[Force]:
@@ -121,8 +327,10 @@ class Plate(Section):
         phi_c = 0.9
 
         P_n_str, P_n = chapter_E.sec_E3(self, L_c, axis, **string_options)
-        template = templates["Plate_compression_capacity"]
-        return fill_template((phi_c, P_n), template, locals(), **string_options)
+        if not string_requested(string_options):
+            return Result("", (phi_c, P_n))
+        return fill_template((phi_c, P_n), templates["Plate_compression_capacity"],
+            {"P_n_str": P_n_str}, **string_options)
 
     def moment_capacity(self, L_b: Length = 0*unit.ft, axis: str = "x",
             C_b: float = 1, **string_options) -> Result[Moment]:
@@ -144,16 +352,20 @@ class Plate(Section):
 
         if axis == "x":
             M_n_str, M_n = chapter_F.sec_F11(self, L_b, C_b, **string_options)
-            template = templates["Plate_moment_capacity_x"]
+            template = "Plate_moment_capacity_x"
+            variables = {"M_n_str": M_n_str}
         elif axis == "y":
             F_y = self.F_y
             Z_y = self.Z_y
             S_y = self.S_y
-            M_n = min(F_y*Z_y, 1.5*F_y*S_y).to("kipft")
-            template = templates["Plate_moment_capacity_y"]
+            M_n = F_y.m_as("ksi")*min(Z_y.m_as("inch**3"), 1.5*S_y.m_as("inch**3"))/12*unit.kipft
+            template = "Plate_moment_capacity_y"
+            variables = {"F_y": F_y, "Z_y": Z_y, "S_y": S_y, "M_n": M_n}
         else:
             raise ValueError(f"Unsupported axis: {axis}")
-        return fill_template((phi_b, M_n), template, locals(), **string_options)
+        if not string_requested(string_options):
+            return Result("", (phi_b, M_n))
+        return fill_template((phi_b, M_n), templates[template], variables, **string_options)
 
 
 class RectHSS(Section):
@@ -180,20 +392,16 @@ class RoundHSS(Section):
         material : materials.Steel
             Material to use for the member"""
         self.size = size
-        properties = self.database.loc[size, :].to_dict()
+        properties = self.rows()[size]
         if not material:
             if properties["type"] == "RoundHSS":
                 material = self.RoundHSS_default_material
             else:
                 material = self.Pipe_default_material
-        self.material = material
-        material = materials.loc[material, :].to_dict()
-        properties.update(material)
-        for attribute, value in properties.items():
-            setattr(self, attribute, value)
+        self._load_rows(properties, material)
 
 
-class WideFlange(Section):
+class WideFlange(_F2Section):
     """Class to represent wide-flange shapes"""
     database = read_data_table(resources.joinpath("WideFlange.csv"))
     default_material = "A992"
@@ -215,14 +423,37 @@ class WideFlange(Section):
         C_b : float
             Lateral-torsional buckling modification factor"""
         phi_b = 0.9
-        _, lamb_pw = chapter_B.table_B4_1b_15_lamb_p(self.E, self.F_y, return_string=False)
-        _, lamb_pf = chapter_B.table_B4_1b_10_lamb_p(self.E, self.F_y, return_string=False)
-
-        if self.lamb_w >= lamb_pw:
+        if self.lamb_w >= self.lamb_pw:
             raise ValueError("Only sections with compact webs are supported")
-        elif self.lamb_f >= lamb_pf:
+        elif self.lamb_f >= self.lamb_pf:
             M_n_str, M_n = chapter_F.sec_F3(self, L_b, C_b, **string_options)
         else:
             M_n_str, M_n = chapter_F.sec_F2(self, L_b, C_b, **string_options)
-        template = templates["WideFlange_moment_capacity_x"]
-        return fill_template((phi_b, M_n), template, locals(), **string_options)
+        if not string_requested(string_options):
+            return Result("", (phi_b, M_n))
+        return fill_template((phi_b, M_n), templates["WideFlange_moment_capacity_x"],
+            {"M_n_str": M_n_str}, **string_options)
+
+    def moment_capacity_curve(self, L_b: NumericArray, C_b: float | NumericArray = 1
+            ) -> tuple[float, NumericArray]:
+        """Calculate the nominal moment capacity of an I shape with a compact
+        web according to AISC 360-22 Sections F2 and F3 for an array of
+        unbraced lengths. The values match moment_capacity about the x axis,
+        but the calculation is vectorized and no strings are produced.
+
+        Parameters
+        ==========
+
+        L_b : NumericArray
+            Compression flange unbraced lengths
+
+        C_b : float | NumericArray
+            Lateral-torsional buckling modification factors"""
+        phi_b = 0.9
+        if self.lamb_w >= self.lamb_pw:
+            raise ValueError("Only sections with compact webs are supported")
+        elif self.lamb_f >= self.lamb_pf:
+            M_n = chapter_F.sec_F3_sweep(self, L_b, C_b)
+        else:
+            M_n = chapter_F.sec_F2_sweep(self, L_b, C_b)
+        return phi_b, M_n
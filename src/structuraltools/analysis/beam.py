@@ -13,15 +13,121 @@
 # limitations under the License.
 
 
+from functools import lru_cache
 from typing import Optional
 
 from pint import Quantity
 from sympy import lambdify, Piecewise, Rational, symbols
 from sympy.physics.continuum_mechanics.beam import Beam
+from sympy.printing.numpy import NumPyPrinter
 
 from structuraltools.unit import unit, Length, MomentOfInertia, Stress
 
 
+# Position variable used by SymPy Beam results
+_x = symbols("x")
+
+
+def _rational(value: float) -> Rational:
+    """Convert a float to the Rational of its shortest decimal representation.
+    Rational(float) gives the exact binary fraction, which carries very large
+    denominators through the SymPy solution for values like 0.1.
+
+    Parameters
+    ==========
+
+    value : float
+        Value to convert"""
+    return Rational(repr(float(value)))
+
+class _WherePrinter(NumPyPrinter):
+    """NumPy printer that writes Piecewise expressions as nested numpy.where
+    calls. The beam results are sums of many two branch Piecewise terms from
+    singularity functions, and where is much cheaper than the numpy.select
+    calls lambdify uses by default."""
+    def _print_Piecewise(self, expr) -> str:
+        where = self._module_format(f"{self._module}.where")
+        *branches, (value, condition) = expr.args
+        if condition == True:
+            result = self._print(value)
+        else:
+            nan = self._module_format(f"{self._module}.nan")
+            result = f"{where}({self._print(condition)}, {self._print(value)}, {nan})"
+        for value, condition in reversed(branches):
+            result = f"{where}({self._print(condition)}, {self._print(value)}, {result})"
+        return result
+
+def _build_beam(beam_args: tuple, supports: tuple, loads: tuple) -> tuple[Beam, dict]:
+    """Create a SymPy Beam with the given supports and loads applied and return
+    it with the reaction symbols of each support
+
+    Parameters
+    ==========
+
+    beam_args : tuple
+        Length, elastic modulus, and second moment of the beam
+
+    supports : tuple
+        Pairs of support name and (location, kind) arguments
+
+    loads : tuple
+        Arguments for Beam.apply_load for each load"""
+    beam = Beam(*beam_args)
+    support_symbols = {}
+    for name, args in supports:
+        support_symbols.update({name: beam.apply_support(*args)})
+    for load in loads:
+        beam.apply_load(*load)
+    return beam, support_symbols
+
+@lru_cache(maxsize=128)
+def _solve_layout(beam_args: tuple, supports: tuple, layouts: tuple) -> tuple:
+    """Solve a beam with symbolic load magnitudes. Returns the reaction symbols
+    of each support, functions of the load magnitudes for the reactions, and
+    functions of x and the load magnitudes for the shear force, bending moment,
+    and deflection.
+
+    Parameters
+    ==========
+
+    beam_args : tuple
+        Length, elastic modulus, and second moment of the beam
+
+    supports : tuple
+        Pairs of support name and (location, kind) arguments
+
+    layouts : tuple
+        Start, order, and end of each load"""
+    magnitudes = symbols(f"P_0:{len(layouts)}")
+    loads = tuple((magnitude, *layout) for magnitude, layout in zip(magnitudes, layouts))
+    beam, support_symbols = _build_beam(beam_args, supports, loads)
+    support_symbols_list = []
+    for syms in support_symbols.values():
+        if isinstance(syms, tuple):
+            support_symbols_list.extend(syms)
+        else:
+            support_symbols_list.append(syms)
+    beam.solve_for_reaction_loads(*support_symbols_list)
+
+    reactions = {}
+    for name, syms in support_symbols.items():
+        if isinstance(syms, tuple):
+            reaction = [beam.reaction_loads[sym] for sym in syms]
+        else:
+            reaction = beam.reaction_loads[syms]
+        reactions.update({name: lambdify(magnitudes, reaction, "numpy")})
+
+    return (
+        support_symbols,
+        reactions,
+        lambdify([_x, *magnitudes], beam.shear_force().rewrite(Piecewise), "numpy",
+            printer=_WherePrinter, cse=True),
+        lambdify([_x, *magnitudes], beam.bending_moment().rewrite(Piecewise), "numpy",
+            printer=_WherePrinter, cse=True),
+        lambdify([_x, *magnitudes], beam.deflection().rewrite(Piecewise), "numpy",
+            printer=_WherePrinter, cse=True))
+
+
 class ContinuumBeam:
     """Wrapper class for SymPy Beam to allow it to be used with Pint units.
     Select SymPy Beam methods are mirrored or passed through. Other SymPy Beam
@@ -56,12 +162,13 @@ class ContinuumBeam:
         self.force_unit = force_unit
         self.loads = {}
         self.supports = {}
+        self._beam = None
 
         self.moment_unit = f"{force_unit}*{length_unit}"
         self.beam_args = (
-            Rational(length.to(length_unit).magnitude),
-            Rational(elastic_modulus.to(f"{force_unit}/{length_unit}**2").magnitude),
-            Rational(second_moment.to(f"{length_unit}**4").magnitude)
+            _rational(length.to(length_unit).magnitude),
+            _rational(elastic_modulus.to(f"{force_unit}/{length_unit}**2").magnitude),
+            _rational(second_moment.to(f"{length_unit}**4").magnitude)
         )
 
     def apply_support(self, name: str, loc: Length, kind: str) -> None:
@@ -79,7 +186,7 @@ class ContinuumBeam:
         kind : str
             Kind of support to apply. One of: "pin", "roller", or "fixed"."""
         self.supports.update({
-            name: (Rational(loc.to(self.length_unit).magnitude), kind)})
+            name: (_rational(loc.to(self.length_unit).magnitude), kind)})
 
     def apply_load(
         self,
@@ -116,10 +223,10 @@ class ContinuumBeam:
             End point of distributed loads. If not provided it is assumed that
             distributed loads end at the end of the beam."""
         if end is not None:
-            end = Rational(end.to(self.length_unit).magnitude)
+            end = end.m_as(self.length_unit)
         self.loads.update({name: (
-            Rational(value.to(self.moment_unit+f"/{self.length_unit}"*(2+order)).magnitude),
-            Rational(start.to(self.length_unit).magnitude),
+            value.m_as(self.moment_unit+f"/{self.length_unit}"*(2+order)),
+            start.m_as(self.length_unit),
             order,
             end)})
 
@@ -138,43 +245,58 @@ class ContinuumBeam:
             self.loads = {}
 
     def solve_beam(self) -> None:
-        """Solve the beam and store the results"""
-        self.beam = Beam(*self.beam_args)
-
-        self.support_symbols = {}
+        """Solve the beam and store the results. Beams with the same geometry,
+        supports, and load layout share one symbolic solution, so changing
+        only load magnitudes between solves does not repeat the SymPy work."""
+        # Loads are stored as floats and only converted to Rationals here
+        layouts = tuple(
+            (_rational(start), order, None if end is None else _rational(end))
+            for _, start, order, end in self.loads.values())
+        magnitudes = tuple(float(load[0]) for load in self.loads.values())
+        solution = _solve_layout(self.beam_args, tuple(self.supports.items()), layouts)
+        support_symbols, reactions, shear_force, bending_moment, deflection = solution
+        self._solved = (tuple(self.supports.items()), tuple(
+            (_rational(magnitude), *layout) for magnitude, layout in zip(magnitudes, layouts)))
+        self._beam = None
+
+        self.support_symbols = dict(support_symbols)
         self.support_symbols_list = []
-        for name, args in self.supports.items():
-            syms = self.beam.apply_support(*args)
-            self.support_symbols.update({name: syms})
+        for syms in support_symbols.values():
             if isinstance(syms, tuple):
                 self.support_symbols_list.extend(syms)
             else:
                 self.support_symbols_list.append(syms)
 
-        for load in self.loads.values():
-            self.beam.apply_load(*load)
-
-        self.beam.solve_for_reaction_loads(*self.support_symbols_list)
-
         # Store reactions
         self.reactions = {}
-        for name, syms in self.support_symbols.items():
-            if isinstance(syms, tuple):
+        for name, reaction in reactions.items():
+            if isinstance(support_symbols[name], tuple):
+                force, moment = reaction(*magnitudes)
                 self.reactions.update({name: (
-                    float(self.beam.reaction_loads[syms[0]])*unit(self.force_unit),
-                    float(self.beam.reaction_loads[syms[1]])*unit(self.moment_unit))})
+                    float(force)*unit(self.force_unit),
+                    float(moment)*unit(self.moment_unit))})
             else:
                 self.reactions.update({name:
-                    float(self.beam.reaction_loads[syms])*unit(self.force_unit)})
+                    float(reaction(*magnitudes))*unit(self.force_unit)})
 
         # Store shear force, bending moment, and deflection functions
-        x = symbols("x")
         self.shear_force = unit.wraps(self.force_unit, self.length_unit) \
-            (lambdify([x], self.beam.shear_force().rewrite(Piecewise), "numpy"))
+            (lambda x: shear_force(x, *magnitudes))
         self.bending_moment = unit.wraps(self.moment_unit, self.length_unit) \
-            (lambdify([x], self.beam.bending_moment().rewrite(Piecewise), "numpy"))
+            (lambda x: bending_moment(x, *magnitudes))
         self.deflection = unit.wraps(self.length_unit, self.length_unit) \
-            (lambdify([x], self.beam.deflection().rewrite(Piecewise), "numpy"))
+            (lambda x: deflection(x, *magnitudes))
+
+    @property
+    def beam(self) -> Beam:
+        """SymPy Beam with the supports and loads of the last solve_beam call.
+        It is only built when accessed, since solve_beam works from a shared
+        symbolic solution."""
+        if self._beam is None:
+            supports, loads = self._solved
+            self._beam, _ = _build_beam(self.beam_args, supports, loads)
+            self._beam.solve_for_reaction_loads(*self.support_symbols_list)
+        return self._beam
 
     # Pass through draw and plotting functions
     def draw(self, pictorial: bool = True) -> None:
@@ -15,12 +15,12 @@
 
 import importlib.resources
 import json
-from math import e
+from math import exp
 
-from numpy import sqrt
+from numpy import clip, logical_and, ndim, sqrt
 
 from structuraltools.unit import unit, Length, Pressure, Velocity
-from structuraltools.utils import fill_template, read_data_table, Result
+from structuraltools.utils import fill_template, read_data_table, Result, string_requested
 
 
 resources = importlib.resources.files("structuraltools.asce.resources")
@@ -44,8 +44,12 @@ def fig_26_8_1_K_1(K_1_factor: float, H: Length, L_prime_h: Length,
 
     L_prime_h : Length
         L_h modified acconding to ASCE 7-22 Figure 26.8-1 footnote b"""
-    K_1 = (K_1_factor*H/L_prime_h).to("dimensionless").magnitude
-    return fill_template(K_1, templates["fig_26_8_1_K_1"], locals(), **string_options)
+    K_1 = K_1_factor*H.m_as("ft")/L_prime_h.m_as("ft")
+    if not string_requested(string_options):
+        return Result("", K_1)
+    return fill_template(K_1, templates["fig_26_8_1_K_1"],
+        {"K_1_factor": K_1_factor, "H": H, "L_prime_h": L_prime_h, "K_1": K_1},
+        **string_options)
 
 def fig_26_8_1_K_2(x: Length, mu: float, L_prime_h: Length, **string_options
         ) -> Result[float]:
@@ -62,8 +66,11 @@ def fig_26_8_1_K_2(x: Length, mu: float, L_prime_h: Length, **string_options
 
     L_prime_h : Length
         L_h modified according to ASCE 7-22 Figure 26.8-1 footnote b"""
-    K_2 = (1-abs(x)/(mu*L_prime_h)).to("dimensionless").magnitude
-    return fill_template(K_2, templates["fig_26_8_1_K_2"], locals(), **string_options)
+    K_2 = 1-abs(x.m_as("ft"))/(mu*L_prime_h.m_as("ft"))
+    if not string_requested(string_options):
+        return Result("", K_2)
+    return fill_template(K_2, templates["fig_26_8_1_K_2"],
+        {"x": x, "mu": mu, "L_prime_h": L_prime_h, "K_2": K_2}, **string_options)
 
 def fig_26_8_1_K_3(gamma: float, z: Length, L_prime_h: Length, **string_options
         ) -> Result[float]:
@@ -80,8 +87,11 @@ def fig_26_8_1_K_3(gamma: float, z: Length, L_prime_h: Length, **string_options
 
     L_prime_h : Length
         L_h modified according to ASCE 7-22 Figure 26.8-1 footnote b"""
-    K_3 = e**(-gamma*z/L_prime_h)
-    return fill_template(K_3, templates["fig_26_8_1_K_3"], locals(), **string_options)
+    K_3 = exp(-gamma*z.m_as("ft")/L_prime_h.m_as("ft"))
+    if not string_requested(string_options):
+        return Result("", K_3)
+    return fill_template(K_3, templates["fig_26_8_1_K_3"],
+        {"gamma": gamma, "z": z, "L_prime_h": L_prime_h, "K_3": K_3}, **string_options)
 
 def fig_26_8_1_K_zt(K_1: float, K_2: float, K_3: float, **string_options
         ) -> Result[float]:
@@ -100,7 +110,10 @@ def fig_26_8_1_K_zt(K_1: float, K_2: float, K_3: float, **string_options
     K_3 : float
         Factor to account for reduction in speed-up with height above local terrain"""
     K_zt = (1+K_1*K_2*K_3)**2
-    return fill_template(K_zt, templates["fig_26_8_1_K_zt"], locals(), **string_options)
+    if not string_requested(string_options):
+        return Result("", K_zt)
+    return fill_template(K_zt, templates["fig_26_8_1_K_zt"],
+        {"K_1": K_1, "K_2": K_2, "K_3": K_3, "K_zt": K_zt}, **string_options)
 
 def table_26_9_1(z_e: Length, **string_options) -> Result[float]:
     """Calculate the ground elevation factor ($K_e$) according to
@@ -111,9 +124,11 @@ def table_26_9_1(z_e: Length, **string_options) -> Result[float]:
 
     z_e : Length
         Ground elevation above sea level"""
-    z_e = z_e.to("ft")
-    K_e = e**(-0.0000362*z_e.magnitude)
-    return fill_template(K_e, templates["table_26_9_1"], locals(), **string_options)
+    K_e = exp(-0.0000362*z_e.m_as("ft"))
+    if not string_requested(string_options):
+        return Result("", K_e)
+    return fill_template(K_e, templates["table_26_9_1"],
+        {"z_e": z_e.to("ft"), "K_e": K_e}, **string_options)
 
 def table_26_10_1(z: Length, z_g: Length, alpha: float, elevation: str = "z",
         **string_options) -> Result[float]:
@@ -124,7 +139,9 @@ def table_26_10_1(z: Length, z_g: Length, alpha: float, elevation: str = "z",
     ==========
 
     z : Length
-        Elevation above site ground level to calculate K_z at
+        Elevation above site ground level to calculate K_z at. An array of
+        elevations returns an array of K_z values, which requires
+        return_string=False.
 
     z_g : Length
         Terrain exposure constant $z_g$ from ASCE 7-22 Table 26.11-1
@@ -135,10 +152,20 @@ def table_26_10_1(z: Length, z_g: Length, alpha: float, elevation: str = "z",
     elevation : str
         String to use to indicate elevation when displaying the calculation.
         defaults to "z" """
-    if z < 0*unit.ft or 3280*unit.ft < z:
+    z_ft = z.m_as("ft")
+    if not logical_and(0 <= z_ft, z_ft <= 3280).all():
         raise ValueError("z is outside of the bounds supported by ASCE 7-22")
-    K_z = (2.41*(min(max(15*unit.ft, z), z_g)/z_g)**(2/alpha)).to("dimensionless").magnitude
-    return fill_template(K_z, templates["table_26_10_1"], locals(), **string_options)
+    z_g_ft = z_g.m_as("ft")
+    K_z = 2.41*(clip(z_ft, 15, z_g_ft)/z_g_ft)**(2/alpha)
+    if ndim(K_z) == 0:
+        K_z = float(K_z)
+    if not string_requested(string_options):
+        return Result("", K_z)
+    if ndim(K_z):
+        raise ValueError("Strings can only be filled for a single elevation; "
+            "use return_string=False for arrays of z")
+    return fill_template(K_z, templates["table_26_10_1"], {"z": z, "z_g": z_g,
+        "alpha": alpha, "elevation": elevation, "K_z": K_z}, **string_options)
 
 def eq_26_10_1(K_z: float, K_zt: float, K_e: float, V: Velocity,
         elevation: str = "z", **string_options) -> Result[Pressure]:
@@ -148,7 +175,9 @@ def eq_26_10_1(K_z: float, K_zt: float, K_e: float, V: Velocity,
     ==========
 
     K_z : float
-        Velocity pressure exposure coefficient from ASCE 7-22 Table 26.10-1
+        Velocity pressure exposure coefficient from ASCE 7-22 Table 26.10-1.
+        An array of K_z values returns an array of pressures, which requires
+        return_string=False.
 
     K_zt : float
         Topographic factor from ASCE 7-22 Figure 26.8-1
@@ -162,9 +191,15 @@ def eq_26_10_1(K_z: float, K_zt: float, K_e: float, V: Velocity,
     elevation : str
         String to use to indicate elevation when displaying the calculation.
         defaults to "z" """
-    V = V.to("mph")
-    q_z = 0.00256*K_z*K_zt*K_e*((V.magnitude)**2)*unit.psf
-    return fill_template(q_z, templates["eq_26_10_1"], locals(), **string_options)
+    q_z = 0.00256*K_z*K_zt*K_e*V.m_as("mph")**2*unit.psf
+    if not string_requested(string_options):
+        return Result("", q_z)
+    if ndim(q_z.magnitude):
+        raise ValueError("Strings can only be filled for a single pressure; "
+            "use return_string=False for arrays of inputs")
+    return fill_template(q_z, templates["eq_26_10_1"], {"K_z": K_z, "K_zt": K_zt,
+        "K_e": K_e, "V": V.to("mph"), "elevation": elevation, "q_z": q_z},
+        **string_options)
 
 def eq_26_11_6(I_bar_z: float, Q: float, axis: str = "", g_Q: float = 3.4, g_v:
         float = 3.4, **string_options) -> Result[float]:
@@ -190,7 +225,10 @@ def eq_26_11_6(I_bar_z: float, Q: float, axis: str = "", g_Q: float = 3.4, g_v:
         Factor defined in ASCE 7-22 Section 26.22.4. This can always be left as
         the default value."""
     G = 0.925*(1+1.7*g_Q*I_bar_z*Q)/(1+1.7*g_v*I_bar_z)
-    return fill_template(G, templates["eq_26_11_6"], locals(), **string_options)
+    if not string_requested(string_options):
+        return Result("", G)
+    return fill_template(G, templates["eq_26_11_6"], {"I_bar_z": I_bar_z, "Q": Q,
+        "axis": axis, "g_Q": g_Q, "g_v": g_v, "G": G}, **string_options)
 
 def eq_26_11_7(c: float, bar_z: Length, **string_options) -> Result[float]:
     """ASCE 7-22 Equation 26.11-7
@@ -204,10 +242,11 @@ def eq_26_11_7(c: float, bar_z: Length, **string_options) -> Result[float]:
     bar_z : Length
         Equivalent height of the structure as defined in
         ASCE 7-22 Section 26.11.4"""
-
-    bar_z = bar_z.to("ft")
-    I_bar_z = c*(33/bar_z.magnitude)**(1/6)
-    return fill_template(I_bar_z, templates["eq_26_11_7"], locals(), **string_options)
+    I_bar_z = c*(33/bar_z.m_as("ft"))**(1/6)
+    if not string_requested(string_options):
+        return Result("", I_bar_z)
+    return fill_template(I_bar_z, templates["eq_26_11_7"],
+        {"c": c, "bar_z": bar_z.to("ft"), "I_bar_z": I_bar_z}, **string_options)
 
 def eq_26_11_8(L: Length, h: Length, L_bar_z: Length, axis_1: str = "",
         axis_2: str = "", **string_options) -> Result[float]:
@@ -231,8 +270,12 @@ def eq_26_11_8(L: Length, h: Length, L_bar_z: Length, axis_1: str = "",
     axis_2 : str
         Subscript to indicate the axis perpendicular to the axis the gust effect
         factor is calculated for"""
-    Q = sqrt(1/(1+0.63*((L+h)/L_bar_z)**0.63)).to("dimensionless").magnitude
-    return fill_template(Q, templates["eq_26_11_8"], locals(), **string_options)
+    Q = sqrt(1/(1+0.63*((L.m_as("ft")+h.m_as("ft"))/L_bar_z.m_as("ft"))**0.63))
+    if not string_requested(string_options):
+        return Result("", Q)
+    return fill_template(Q, templates["eq_26_11_8"], {"L": L, "h": h,
+        "L_bar_z": L_bar_z, "axis_1": axis_1, "axis_2": axis_2, "Q": Q},
+        **string_options)
 
 def eq_26_11_9(L: Length, bar_z: Length, bar_epsilon: float, **string_options
                ) -> Result[Length]:
@@ -250,6 +293,9 @@ def eq_26_11_9(L: Length, bar_z: Length, bar_epsilon: float, **string_options
 
     bar_epsilon : float
         Terrain exposure constant $\bar{\epsilon}$ for ASCE 7-22 Table 26.11-1"""
-    bar_z = bar_z.to("ft")
-    L_bar_z = L*(bar_z.magnitude/33)**bar_epsilon
-    return fill_template(L_bar_z, templates["eq_26_11_9"], locals(), **string_options)
+    L_bar_z = L*(bar_z.m_as("ft")/33)**bar_epsilon
+    if not string_requested(string_options):
+        return Result("", L_bar_z)
+    return fill_template(L_bar_z, templates["eq_26_11_9"], {"L": L,
+        "bar_z": bar_z.to("ft"), "bar_epsilon": bar_epsilon, "L_bar_z": L_bar_z},
+        **string_options)
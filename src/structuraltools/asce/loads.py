@@ -13,37 +13,39 @@
 # limitations under the License.
 
 
-from collections.abc import Iterable
 import importlib.resources
-from itertools import product
 import json
+from collections.abc import Iterable
+from itertools import product
 from typing import NamedTuple
 
-from numpy import maximum, minimum, sign
 import pandas as pd
+from numpy import arange, array, maximum, ndarray, newaxis, sign, zeros
 
 from structuraltools.unit import Numeric, NumericArray
 
-
 pd.options.mode.copy_on_write = True
 resources = importlib.resources.files("structuraltools.asce.resources")
 
 
-def _does_not_control(testing: pd.Series, other: pd.Series) -> bool:
-    """Check if all testing load combination might be the controlling load
-    combination if the other load combination is also checked
+def _magnitudes(combs: pd.DataFrame) -> ndarray:
+    """Return the values of a set of load combinations as a float array. Each
+    column is converted to the units of its first value.
 
     Parameters
     ==========
 
-    testing : pd.Series
-        Load combination that is currently being checked
-
-    other : pd.Series
-        Load combination that is beign checked against"""
-    less_equal = all(testing.abs() <= other.abs())
-    same_signs = all(sign(testing) == sign(other))
-    return less_equal and same_signs
+    combs : pd.DataFrame
+        Set of load combinations to convert"""
+    columns = []
+    for name in combs.columns:
+        column = combs[name]
+        units = getattr(column.iloc[0], "units", None)
+        if units is None:
+            columns.append(column.to_numpy(dtype=float))
+        else:
+            columns.append([value.m_as(units) for value in column])
+    return array(columns, dtype=float).T
 
 def reduce_combs(combs: pd.DataFrame) -> pd.DataFrame:
     """Reduces the provided set of load combinations to only the set of load
@@ -54,23 +56,20 @@ def reduce_combs(combs: pd.DataFrame) -> pd.DataFrame:
 
     combs : pd.DataFrame
         Set of load combinations to reduce"""
-    reduced_combs = pd.DataFrame(columns=combs.columns)
-    for current_name in tuple(combs.index):
-        current = combs.loc[current_name, :]
-        combs = combs.drop(current_name)
-        add_to_reduced = True
-        for _, other in reduced_combs.iterrows():
-            if _does_not_control(current, other):
-                add_to_reduced = False
-                break
-        if add_to_reduced:
-            for _, other in combs.iterrows():
-                if _does_not_control(current, other):
-                    add_to_reduced = False
-                    break
-        if add_to_reduced:
-            reduced_combs.loc[current_name, :] = current
-    return reduced_combs
+    if combs.empty:
+        return combs
+    values = _magnitudes(combs)
+    magnitudes = abs(values)
+    signs = sign(values)
+    # covers[j, i] is True where combination j has the same signs as i and
+    # magnitudes at least as large, so i cannot control if j is also checked
+    covers = (magnitudes[newaxis, :, :] <= magnitudes[:, newaxis, :]).all(axis=2) \
+        & (signs[newaxis, :, :] == signs[:, newaxis, :]).all(axis=2)
+    # Identical combinations cover each other, so only the last one is kept
+    position = arange(len(combs))
+    later = position[:, newaxis] > position[newaxis, :]
+    dropped = (covers & (later | ~covers.T)).any(axis=0)
+    return combs[~dropped]
 
 
 class LoadCase(NamedTuple):
@@ -109,6 +108,26 @@ class LoadComb:
         self.time_factor = time_factor
         self.factors = factors
 
+    def case_factors(self, load_kinds: list[list[LoadCase]]
+            ) -> list[tuple[LoadCaseFactor, ...]]:
+        """Return the unique sets of factored load cases the load combination
+        produces. Only the load kinds with a factor are expanded, so each set
+        is generated once.
+
+        Parameters
+        ==========
+
+        load_kinds : list[list[LoadCase]]
+            Load cases of each load kind provided by a LoadCollector"""
+        factored_kinds = [
+            [LoadCaseFactor(case.kind, case.case, factor) for case in cases]
+            for cases in load_kinds
+            if cases and (factor := self.factors.get(cases[0].kind))
+        ]
+        if not factored_kinds:
+            return []
+        return list(product(*factored_kinds))
+
     def eval_loads(
             self,
             loads: dict[str, dict[str, Numeric | NumericArray]],
@@ -186,8 +205,8 @@ class LoadCollector:
             types, but the type must be consistent across all values added to
             the LoadCollector."""
         if isinstance(kind, str) and isinstance(case, str):
-            self.loads.update({kind: self.loads.get(kind, {})})
-            self.loads[kind].update({case: self.loads[kind].get(case, 0)+value})
+            cases = self.loads.setdefault(kind, {})
+            cases[case] = cases.get(case, 0)+value
         else:
             if isinstance(kind, str):
                 kind_case = product({kind}, case)
@@ -210,46 +229,59 @@ class LoadCollector:
            combs : iterable
                Iterable of load combinations. Each load combination should
                be a dictionary with keys that match the load kinds"""
-        # Generate an exhaustive list of list of LoadCase from the load
-        # dictionary that includes all relevant combinations of load cases.
+        # Generate a list of LoadCase for each load kind in the load dictionary
         load_kinds = []
         for kind, cases in self.loads.items():
             load_cases = []
             for case in cases.keys():
                 load_cases.append(LoadCase(kind, case))
             load_kinds.append(load_cases)
-        case_combs = list(product(*load_kinds))
-
-        # The supplied load cases have a method to evaluate themselves for all
-        # of the case combinations provided and return all of the raw results
-        # as a set of LoadCombResult.
-        factored_load = {"combs": []}
-        for comb in combs:
-            factored_load["combs"].extend(comb.eval_loads(self.loads, case_combs))
-
-        # Check if the loads in the load collector are array like
-        try:
-            _ = factored_load["combs"][0].result[0]
-            array_like = True
-        except (IndexError, TypeError):
-            array_like = False
+
+        # The supplied load combinations provide the unique sets of factored
+        # load cases for the load kinds they include. The factors are
+        # collected into a matrix with one row per set and one column per load
+        # case, so every combination is evaluated by one matrix product.
+        comb_factors = [(comb, factors) for comb in combs
+            for factors in comb.case_factors(load_kinds)]
+        load_cases = [case for cases in load_kinds for case in cases]
+        columns = {case: column for column, case in enumerate(load_cases)}
+        factor_matrix = zeros((len(comb_factors), len(load_cases)))
+        for row, (_, factors) in enumerate(comb_factors):
+            for factor in factors:
+                factor_matrix[row, columns[(factor.kind, factor.case)]] = factor.factor
+        values = [self.loads[case.kind][case.case] for case in load_cases]
+        units = getattr(values[0], "units", None)
+        if units is not None:
+            values = [value.m_as(units) for value in values]
+        results = factor_matrix @ array(values, dtype=float)
+        array_like = results.ndim > 1
+        if units is not None:
+            results = results*units
+
+        factored_load = {"combs": [
+            LoadCombResult(comb.name, comb.time_factor, factors, result)
+            for (comb, factors), result in zip(comb_factors, results)
+        ]}
 
         # Envelope the load combination results
-        for comb in factored_load["combs"]:
-            if array_like:
-                factored_load.update({"max_envelope": maximum(
-                    factored_load.get("max_envelope", comb.result), comb.result)})
-                factored_load.update({"min_envelope": minimum(
-                    factored_load.get("min_envelope", comb.result), comb.result)})
-                max_value = max(comb.result)
-                min_value = min(comb.result)
-            else:
-                max_value = comb.result
-                min_value = comb.result
-            if max_value >= factored_load.get("max_value", max_value):
-                factored_load.update({"max_value": max_value, "max_comb": comb})
-            if min_value <= factored_load.get("min_value", min_value):
-                factored_load.update({"min_value": min_value, "min_comb": comb})
+        if array_like:
+            factored_load.update({
+                "max_envelope": results.max(axis=0),
+                "min_envelope": results.min(axis=0)
+            })
+            max_values = results.max(axis=1)
+            min_values = results.min(axis=1)
+        else:
+            max_values = results
+            min_values = results
+        max_index = max_values.argmax()
+        min_index = min_values.argmin()
+        factored_load.update({
+            "max_value": max_values[max_index],
+            "max_comb": factored_load["combs"][max_index],
+            "min_value": min_values[min_index],
+            "min_comb": factored_load["combs"][min_index]
+        })
 
         if abs(factored_load["max_value"]) >= abs(factored_load["min_value"]):
             factored_load.update({
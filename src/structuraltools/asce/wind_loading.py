@@ -21,12 +21,15 @@ from numpy import log10, sign
 
 from structuraltools.asce import chapter_26
 from structuraltools.unit import unit, Area, Length, Pressure, Velocity
-from structuraltools.utils import convert_to_unit, fill_template, linterp_dicts, Result
+from structuraltools.utils import (convert_to_unit, fill_template, linterp_dicts, Result,
+    string_requested)
 
 
 resources = importlib.resources.files("structuraltools.asce.resources")
 with open(resources.joinpath("wind_loading_templates_processed.json")) as file:
     templates = json.load(file)
+with open(resources.joinpath("topo_coefficients.json")) as file:
+    topo_coefficients = json.load(file)
 
 
 def calc_K_zt(feature: str, H: Length, L_h: Length, x: Length, z: Length,
@@ -62,8 +65,7 @@ def calc_K_zt(feature: str, H: Length, L_h: Length, x: Length, z: Length,
     location : str, optional
         On of: "upwind" or "downwind", indicating the location of the structure
         relative to the feature. Conservatively defaults to "downwind"."""
-    with open(resources.joinpath("topo_coefficients.json"), "r") as file:
-        topo_coefs = json.load(file)[feature]
+    topo_coefs = topo_coefficients[feature]
 
     L_prime_h = max(L_h, 2*H)
     K_1_str, K_1 = chapter_26.fig_26_8_1_K_1(topo_coefs["K_1/(H/L_h)"][exposure],
@@ -73,6 +75,8 @@ def calc_K_zt(feature: str, H: Length, L_h: Length, x: Length, z: Length,
     K_3_str, K_3 = chapter_26.fig_26_8_1_K_3(topo_coefs["gamma"], z, L_prime_h,
         **string_options)
     K_zt_str, K_zt = chapter_26.fig_26_8_1_K_zt(K_1, K_2, K_3, **string_options)
+    if not string_requested(string_options):
+        return Result("", K_zt)
     return fill_template(K_zt, templates["calc_K_zt"], locals(), **string_options)
 
 def calc_wind_server_inputs(
@@ -435,8 +439,10 @@ class MainWindServer:
             case "q_h":
                 q_z = self.q_h
             case "q_z":
-                K_z_str, K_z = chapter_26.table_26_10_1(d, self.z_g, self.alpha)
-                q_z_str, q_z = chapter_26.eq_26_10_1(K_z, self.K_zt, self.K_e, self.V)
+                K_z_str, K_z = chapter_26.table_26_10_1(d, self.z_g, self.alpha,
+                    return_string=False)
+                q_z_str, q_z = chapter_26.eq_26_10_1(K_z, self.K_zt, self.K_e, self.V,
+                    return_string=False)
             case "q_p":
                 q_z = self.q_p
 
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Callable
+from functools import lru_cache, wraps
 import importlib.resources
 import json
+from string import Formatter
 from typing import NamedTuple
 import warnings
 
@@ -30,6 +33,9 @@ with open(resources.joinpath("utils_templates_processed.json")) as file:
     templates = json.load(file)
 
 
+formatter = Formatter()
+
+
 class Result[ValueType](NamedTuple):
     string: str
     value: ValueType
@@ -80,24 +86,127 @@ def fill_template(
     if not return_string:
         return Result("", value)
 
+    render = compile_template(template, precision, header_level, header_type,
+        general_format, quantity_format)
+    return Result(render(variables), value)
+
+@lru_cache(maxsize=4096)
+def compile_template(
+        template: str,
+        precision: int = 4,
+        header_level: int = 4,
+        header_type: str = "markdown",
+        general_format: str = "g",
+        quantity_format: str = "~L") -> Callable[[dict[str: any]], str]:
+    """Parse a template once for a set of string options and return a function
+    that fills it from a dictionary of variables. The option fields and format
+    specifications are resolved here, so filling the template only formats the
+    variable values. Results are cached for each template and set of options.
+
+    Parameters
+    ==========
+
+    template : str
+        String to use as the template for the result string
+
+    precision : int
+        Precision value to use when filling the template
+
+    header_level : int
+        Header level to use when filling in templates
+
+    header_type : str
+        Type of headers to use. One of: "markdown" or "html"
+
+    general_format : str
+        Format code to use when filling the template
+
+    quantity_format : str
+        Additional format code to use for quantities when filling the template"""
     if header_type == "markdown":
-        headers = {"_header_": f"{"#"*header_level} ", "_h_start_": "", "_h_end_": ""}
+        options = {"_header_": f"{"#"*header_level} ", "_h_start_": "", "_h_end_": ""}
     elif header_type == "html":
-        headers = {
+        options = {
             "_header_": "",
             "_h_start_": f"<h{header_level}>",
             "_h_end_": f"</h{header_level}>"
         }
     else:
         raise ValueError(f"Unrecognized header type: {header_type}")
+    options.update({
+        "_precision_": precision,
+        "_gformat_": general_format,
+        "_qformat_": quantity_format
+    })
+
+    fields = []
+    literal = ""
+    for text, name, spec, _ in formatter.parse(template):
+        literal += text
+        if name is None:
+            continue
+        spec = spec.format(**options)
+        if name in options:
+            literal += format(options[name], spec)
+        else:
+            fields.append((literal, name, spec))
+            literal = ""
+
+    def render(variables: dict[str: any]) -> str:
+        parts = []
+        for text, name, spec in fields:
+            parts.append(text)
+            parts.append(format(variables[name], spec))
+        parts.append(literal)
+        return "".join(parts)
+
+    return render
+
+def string_requested(string_options: dict[str, any]) -> bool:
+    """Check whether a calculation function should fill its template string.
+    This allows functions to skip work that is only needed for the string.
+
+    Parameters
+    ==========
+
+    string_options : dict[str, any]
+        String options passed to the calculation function"""
+    return string_options.get("return_string", True)
+
+def cache_values(function: Callable[..., Result]) -> Callable[..., Result]:
+    """Decorator to cache the results of a calculation function when it is
+    called with return_string=False. Calls that fill a template are always
+    evaluated. Results are only cached when all arguments are hashable. When
+    the first argument has a result_cache, such as an aisc section, results
+    are stored there so they are released with the section and cleared when
+    it is modified. Other results are kept for the 256 most recent calls.
+
+    Parameters
+    ==========
 
-    string = template.format(
-        _precision_=precision,
-        _gformat_=general_format,
-        _qformat_=quantity_format,
-        **headers,
-        **variables)
-    return Result(string, value)
+    function : Callable[..., Result]
+        Calculation function to cache the results of"""
+    cached_function = lru_cache(maxsize=256)(function)
+
+    @wraps(function)
+    def wrapper(*args, **kwargs) -> Result:
+        if string_requested(kwargs):
+            return function(*args, **kwargs)
+        results = getattr(args[0], "result_cache", None) if args else None
+        key = (args if results is None else args[1:], tuple(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return function(*args, **kwargs)
+        if results is None:
+            return cached_function(*args, **kwargs)
+        key = (function, *key)
+        if key not in results:
+            results[key] = function(*args, **kwargs)
+        return results[key]
+
+    wrapper.cache_clear = cached_function.cache_clear
+    return wrapper
 
 def process_templates( module: str, filename: str) -> None:
     """Function to process template files into the form used by python functions
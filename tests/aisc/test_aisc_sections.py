@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from numpy import isclose
+from numpy import array, isclose
+import pytest
 
 from structuraltools import aisc
 from structuraltools.unit import unit
@@ -180,6 +181,38 @@ def test_WideFlange_init():
     assert wide_flange.W == 12*unit.plf
     assert wide_flange.F_y == 36*unit.ksi
 
+def test_WideFlange_F2_properties():
+    wide_flange = aisc.WideFlange("W12X22")
+    assert isclose(wide_flange.M_p, 122.0833333*unit.kipft, atol=1e-7*unit.kipft)
+    assert wide_flange.c == 1
+    assert isclose(wide_flange.L_p, 2.995306513*unit.ft, atol=1e-8*unit.ft)
+    assert isclose(wide_flange.L_r, 9.132623412*unit.ft, atol=1e-8*unit.ft)
+
+def test_WideFlange_slenderness_limits():
+    wide_flange = aisc.WideFlange("W10X12")
+    assert isclose(wide_flange.lamb_pf, 9.151611880, atol=1e-9)
+    assert isclose(wide_flange.lamb_rf, 24.08318916, atol=1e-8)
+    assert isclose(wide_flange.lamb_pw, 90.55279123, atol=1e-8)
+    assert isclose(wide_flange.k_c, 0.5859587353, atol=1e-10)
+
+def test_Channel_F2_properties():
+    channel = aisc.Channel("C8X11.5")
+    assert isclose(channel.c, 1.072132193, atol=1e-9)
+
+def test_F2_catalog():
+    catalog = aisc.Channel.catalog("A36")
+    index = aisc.Channel.database.index.get_loc("C8X11.5")
+    assert isclose(catalog["c"][index], 1.072132193, atol=1e-9)
+    assert isclose(catalog["S_x"][index], 8.14)
+    assert catalog["F_y"][index] == 36
+
+def test_F2_catalog_read_only():
+    catalog = aisc.WideFlange.catalog()
+    with pytest.raises(ValueError):
+        catalog["S_x"][0] = 0
+    with pytest.raises(TypeError):
+        catalog["S_x"] = None
+
 
 class TestWideFlange:
     def test_moment_capacity_plastic(self):
@@ -347,3 +380,39 @@ $$
     M_n &= \operatorname{min}\left(M_{ltb},\ M_{flb}\right) = \operatorname{min}\left(52.5\ \mathrm{kipft},\ 52.11\ \mathrm{kipft}\right) &= 52.11\ \mathrm{kipft}
 \end{aligned}
 $$"""
+
+def test_Plate_from_arrays():
+    plates = aisc.Plate.from_arrays(array([6, 12])*unit.inch, 1*unit.inch, "A36")
+    for index, d in enumerate((6, 12)):
+        plate = aisc.Plate(d*unit.inch, 1*unit.inch, "A36")
+        for name, units in (("A", "inch**2"), ("S_x", "inch**3"), ("r_x", "inch"),
+                ("Z_y", "inch**3"), ("I_y", "inch**4"), ("F_y", "ksi")):
+            assert isclose(plates[name][index], getattr(plate, name).m_as(units))
+
+def test_Section_rows():
+    rows = aisc.WideFlange.rows()
+    assert rows is aisc.WideFlange.rows()
+    assert rows["W12X26"] == aisc.WideFlange.database.loc["W12X26", :].to_dict()
+
+def test_Section_get():
+    section = aisc.WideFlange.get("W12X26")
+    assert section is aisc.WideFlange.get("W12X26")
+    assert section is not aisc.WideFlange.get("W12X26", "A36")
+    assert isinstance(aisc.Plate.get(12*unit.inch, 1*unit.inch, "A36"), aisc.Plate)
+
+def test_Section_result_cache():
+    section = aisc.WideFlange("W12X26")
+    section.result_cache["key"] = 1
+    assert section.result_cache == {"key": 1}
+    section.F_y = 36*unit.ksi
+    assert section.result_cache == {}
+
+def test_WideFlange_moment_capacity_curve():
+    L_b = array([0, 5, 15, 30])*unit.ft
+    for size in ("W12X22", "W21X48"):
+        wide_flange = aisc.WideFlange(size)
+        phi_b, M_n = wide_flange.moment_capacity_curve(L_b, 1.1)
+        for L_b_single, M_n_curve in zip(L_b, M_n):
+            _, phiM_n = wide_flange.moment_capacity(L_b_single, C_b=1.1, return_string=False)
+            assert phi_b == phiM_n[0]
+            assert isclose(M_n_curve, phiM_n[1], atol=1e-8*unit.kipft)
@@ -13,7 +13,12 @@
 # limitations under the License.
 
 
-from numpy import isclose
+import gc
+import warnings
+import weakref
+
+import pytest
+from numpy import array, isclose, linspace
 
 from structuraltools import aisc
 from structuraltools.aisc import chapter_F
@@ -253,6 +258,62 @@ $$
 \end{aligned}
 $$"""
 
+def test_sec_F2_2_no_string_matches_string():
+    section = aisc.WideFlange("W12X22")
+    _, M_p = chapter_F.sec_F2_1(section)
+    for L_b in (2*unit.ft, 7*unit.ft, 15*unit.ft):
+        _, M_ltb_string = chapter_F.sec_F2_2(section, L_b, M_p, 1.2)
+        string, M_ltb = chapter_F.sec_F2_2(section, L_b, M_p, 1.2, return_string=False)
+        assert string == ""
+        assert isclose(M_ltb, M_ltb_string, atol=1e-8*unit.kipft)
+
+def test_sec_F2_no_string():
+    section = aisc.WideFlange("W12X22", "A992")
+    string, M_n = chapter_F.sec_F2(section, 7*unit.ft, 1, return_string=False)
+    assert isclose(M_n, 90.76259620*unit.kipft, atol=1e-8*unit.kipft)
+    assert string == ""
+
+def test_sec_F2_no_string_matches_string():
+    section = aisc.WideFlange("W12X22", "A992")
+    for L_b in (2*unit.ft, 7*unit.ft, 15*unit.ft):
+        _, M_n = chapter_F.sec_F2(section, L_b, 1.2)
+        _, M_n_fast = chapter_F.sec_F2(section, L_b, 1.2, return_string=False)
+        assert isclose(M_n, M_n_fast, atol=1e-8*unit.kipft)
+
+def test_sec_F2_modified_section():
+    section = aisc.WideFlange("W18X50")
+    _, M_n = chapter_F.sec_F2(section, 10*unit.ft, 1.0, return_string=False)
+    assert isclose(M_n, 360.21*unit.kipft, atol=0.01*unit.kipft)
+    section.F_y = 36*unit.ksi
+    _, M_n = chapter_F.sec_F2(section, 10*unit.ft, 1.0, return_string=False)
+    _, M_n_string = chapter_F.sec_F2(section, 10*unit.ft, 1.0)
+    assert isclose(M_n, 277.12*unit.kipft, atol=0.01*unit.kipft)
+    assert M_n == M_n_string
+
+def test_sec_F2_releases_section():
+    section = aisc.WideFlange("W18X50")
+    chapter_F.sec_F2(section, 10*unit.ft, 1.0, return_string=False)
+    reference = weakref.ref(section)
+    del section
+    gc.collect()
+    assert reference() is None
+
+def test_sec_F2_batch():
+    sections = [aisc.WideFlange(size) for size in ("W12X22", "W14X22", "W18X35")]
+    M_n = chapter_F.sec_F2_batch(sections, 7*unit.ft, 1)
+    assert M_n.units == "kipft"
+    for section, M_n_batch in zip(sections, M_n):
+        _, M_n_single = chapter_F.sec_F2(section, 7*unit.ft, 1)
+        assert isclose(M_n_batch, M_n_single, atol=1e-8*unit.kipft)
+
+def test_sec_F2_sweep():
+    section = aisc.WideFlange("W12X22")
+    L_b = linspace(0, 20, 9)*unit.ft
+    M_n = chapter_F.sec_F2_sweep(section, L_b, 1.2)
+    for L_b_single, M_n_sweep in zip(L_b, M_n):
+        _, M_n_single = chapter_F.sec_F2(section, L_b_single, 1.2)
+        assert isclose(M_n_sweep, M_n_single, atol=1e-8*unit.kipft)
+
 def test_eq_F3_1():
     string, M_flb = chapter_F.eq_F3_1(
         M_p=122*unit.kipft,
@@ -386,6 +447,75 @@ $$
 \end{aligned}
 $$"""
 
+def test_sec_F3_no_string():
+    section = aisc.WideFlange("W10X12", "A992")
+    string, M_n = chapter_F.sec_F3(section, 0*unit.ft, 1, return_string=False)
+    assert isclose(M_n, 52.11390857*unit.kipft, atol=1e-8*unit.kipft)
+    assert string == ""
+
+def test_sec_F2_batch_empty():
+    with pytest.raises(ValueError):
+        chapter_F.sec_F2_batch([], 10*unit.ft, 1)
+    with pytest.raises(ValueError):
+        chapter_F.sec_F3_batch([], 10*unit.ft, 1)
+
+def test_sec_F2_batch_plastic():
+    sections = [aisc.WideFlange(size) for size in ("W12X22", "W14X22")]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        M_n = chapter_F.sec_F2_batch(sections, 0*unit.ft, 1)
+    assert all(isclose(M_n, [section.M_p for section in sections]))
+
+def test_sec_F2_batch_grid():
+    sections = [aisc.WideFlange(size) for size in ("W12X22", "W14X22", "W18X35")]
+    L_b = linspace(0, 20, 5)*unit.ft
+    M_n = chapter_F.sec_F2_batch(sections, L_b, 1)
+    assert M_n.shape == (3, 5)
+    for section, row in zip(sections, M_n):
+        assert all(isclose(row, chapter_F.sec_F2_sweep(section, L_b, 1)))
+
+def test_sec_F2_batch_mixed():
+    sections = [aisc.WideFlange("W12X22"), aisc.WideFlange("W12X22", "A36"),
+        aisc.Channel("C8X11.5")]
+    M_n = chapter_F.sec_F2_batch(sections, 7*unit.ft, 1)
+    for section, M_n_batch in zip(sections, M_n):
+        _, M_n_single = chapter_F.sec_F2(section, 7*unit.ft, 1)
+        assert isclose(M_n_batch, M_n_single, atol=1e-8*unit.kipft)
+
+def test_sec_F2_F3():
+    section = aisc.WideFlange("W10X12")
+    for L_b in (0*unit.ft, 5*unit.ft, 15*unit.ft):
+        M_n_F2, M_n_F3 = chapter_F.sec_F2_F3(section, L_b, 1.1)
+        assert isclose(M_n_F2, chapter_F.sec_F2(section, L_b, 1.1).value, atol=1e-8*unit.kipft)
+        assert isclose(M_n_F3, chapter_F.sec_F3(section, L_b, 1.1).value, atol=1e-8*unit.kipft)
+
+def test_sec_F2_F3_catalog():
+    M_n = chapter_F.sec_F2_F3_catalog(aisc.WideFlange, 10*unit.ft, 1)
+    index = aisc.WideFlange.database.index
+    assert len(M_n) == len(index)
+    for size in ("W10X12", "W12X22", "W18X35", "W44X408"):
+        section = aisc.WideFlange(size)
+        if section.lamb_f >= section.lamb_pf:
+            _, expected = chapter_F.sec_F3(section, 10*unit.ft, 1)
+        else:
+            _, expected = chapter_F.sec_F2(section, 10*unit.ft, 1)
+        assert isclose(M_n[index.get_loc(size)], expected, atol=1e-8*unit.kipft)
+
+def test_sec_F3_batch():
+    sections = [aisc.WideFlange(size) for size in ("W10X12", "W12X22", "W14X22")]
+    M_n = chapter_F.sec_F3_batch(sections, 15*unit.ft, 1)
+    for section, M_n_batch in zip(sections, M_n):
+        _, M_n_single = chapter_F.sec_F3(section, 15*unit.ft, 1)
+        assert isclose(M_n_batch, M_n_single, atol=1e-8*unit.kipft)
+
+def test_sec_F3_sweep():
+    section = aisc.WideFlange("W10X12")
+    L_b = linspace(0, 20, 9)*unit.ft
+    M_n = chapter_F.sec_F3_sweep(section, L_b, 1)
+    for L_b_single, M_n_sweep in zip(L_b, M_n):
+        _, M_n_single = chapter_F.sec_F3(section, L_b_single, 1)
+        assert isclose(M_n_sweep, M_n_single, atol=1e-8*unit.kipft)
+
 def test_eq_F11_1():
     string, M_p = chapter_F.eq_F11_1(
         F_y=50*unit.ksi,
@@ -535,3 +665,32 @@ $$
     M_n &= \operatorname{min}\left(M_p,\ M_{ltb}\right) = \operatorname{min}\left(12\ \mathrm{kipft},\ 11.9\ \mathrm{kipft}\right) &= 11.9\ \mathrm{kipft}
 \end{aligned}
 $$"""
+
+def test_sec_F11_no_string_matches_string():
+    section = aisc.Plate(12*unit.inch, 1*unit.inch, "A36")
+    for L_b in (12*unit.inch, 24*unit.inch, 130*unit.inch):
+        _, M_n_string = chapter_F.sec_F11(section, L_b, 1.1)
+        string, M_n = chapter_F.sec_F11(section, L_b, 1.1, return_string=False)
+        assert string == ""
+        assert isclose(M_n, M_n_string, atol=1e-8*unit.kipft)
+
+def test_sec_F11_batch():
+    d = array([6, 12, 18])*unit.inch
+    t = array([0.5, 1, 1.5])*unit.inch
+    plates = aisc.Plate.from_arrays(d, t, "A36")
+    L_b = array([0, 60, 200])*unit.inch
+    M_n = chapter_F.sec_F11_batch(plates, L_b, 1.1)
+    assert M_n.shape == (3, 3)
+    for d_single, t_single, M_n_row in zip(d, t, M_n):
+        section = aisc.Plate(d_single, t_single, "A36")
+        for L_b_single, M_n_batch in zip(L_b, M_n_row):
+            _, M_n_single = chapter_F.sec_F11(section, L_b_single, 1.1)
+            assert isclose(M_n_batch, M_n_single, atol=1e-8*unit.kipft)
+
+def test_sec_F11_sweep():
+    section = aisc.Plate(12*unit.inch, 1*unit.inch, "A36")
+    L_b = linspace(0, 200, 11)*unit.inch
+    M_n = chapter_F.sec_F11_sweep(section, L_b, 1.1)
+    for L_b_single, M_n_sweep in zip(L_b, M_n):
+        _, M_n_single = chapter_F.sec_F11(section, L_b_single, 1.1)
+        assert isclose(M_n_sweep, M_n_single, atol=1e-8*unit.kipft)
@@ -13,7 +13,8 @@
 # limitations under the License.
 
 
-from numpy import isclose
+from numpy import isclose, linspace
+from sympy import Rational
 
 from structuraltools import analysis
 from structuraltools.unit import unit
@@ -41,6 +42,10 @@ class TestContinuumBeam:
         assert isclose(self.beam.supports["start"][0], 0)
         assert self.beam.supports["start"][1] == "pin"
 
+    def test_apply_support_decimal(self):
+        self.beam.apply_support("start", 0.1*unit.inch, "pin")
+        assert self.beam.supports["start"][0] == Rational(1, 10)
+
     def test_apply_load(self):
         self.beam.apply_load(
             name="test",
@@ -74,3 +79,24 @@ class TestContinuumBeam:
         assert isclose(self.beam.shear_force(self.l-1e-10*unit.inch), -W)
         assert isclose(self.beam.bending_moment(self.l-1e-10*unit.inch), -W*self.l/3)
         assert isclose(self.beam.deflection(0*unit.inch), W*self.l**3/(15*self.E*self.I))
+
+    def test_solve_beam_new_magnitude(self):
+        self.beam.apply_support("start", 0*unit.inch, "pin")
+        self.beam.apply_support("end", self.l, "roller")
+        for w in (10*unit.pli, 20*unit.pli):
+            self.beam.apply_load("uniform", w, 0*unit.inch, 0)
+            self.beam.solve_beam()
+            assert isclose(self.beam.reactions["start"], -w*self.l/2)
+            assert isclose(self.beam.bending_moment(self.l/2), w*self.l**2/8)
+        assert float(self.beam.beam.reaction_loads[self.beam.support_symbols["end"]]) == -1200
+
+    def test_solve_beam_array_input(self):
+        self.beam.apply_support("end", self.l, "fixed")
+        self.beam.apply_load("point", 100*unit.lb, 30*unit.inch, -1)
+        self.beam.solve_beam()
+        x = linspace(0, 90, 7)*unit.inch
+        moments = self.beam.bending_moment(x)
+        for x_single, moment in zip(x, moments):
+            assert isclose(self.beam.bending_moment(x_single), moment)
+        assert isclose(moments[0], 0*unit.lbin)
+        assert isclose(moments[-1], -6000*unit.lbin)
@@ -13,7 +13,8 @@
 # limitations under the License.
 
 
-from numpy import isclose
+import pytest
+from numpy import array, isclose
 
 from structuraltools.asce import chapter_26
 from structuraltools.unit import unit
@@ -80,6 +81,32 @@ def test_table_26_10_1_high():
     assert K_h == 2.41
     assert string == r"K_{h} &= 2.41 \cdot \left(\frac{\operatorname{min} \left(\operatorname{max}\left(15\ \mathrm{ft},\ h\right),\ z_g\right)}{z_g}\right)^{\frac{2}{\alpha}} = 2.41 \cdot \left(\frac{\operatorname{min}\left(\operatorname{max}\left(15\ \mathrm{ft},\ 3000\ \mathrm{ft}\right),\ 2460\ \mathrm{ft}\right)}{2460\ \mathrm{ft}}\right)^{\frac{2}{9.8}} &= 2.41"
 
+def test_table_26_10_1_no_string():
+    string, K_z = chapter_26.table_26_10_1(
+        z=10*unit.ft,
+        z_g=chapter_26.table_26_11_1.at["C", "z_g"],
+        alpha=chapter_26.table_26_11_1.at["C", "alpha"],
+        return_string=False)
+    assert isclose(K_z, 0.8511539011, atol=1e-10)
+    assert type(K_z) is float
+    assert string == ""
+
+def test_table_26_10_1_array():
+    string, K_z = chapter_26.table_26_10_1(
+        z=array([10, 100, 3000])*unit.ft,
+        z_g=chapter_26.table_26_11_1.at["C", "z_g"],
+        alpha=chapter_26.table_26_11_1.at["C", "alpha"],
+        return_string=False)
+    assert isclose(K_z, [0.8511539011, 1.253581964, 2.41], atol=1e-9).all()
+    assert string == ""
+
+def test_table_26_10_1_array_string():
+    with pytest.raises(ValueError):
+        chapter_26.table_26_10_1(
+            z=array([10, 100, 3000])*unit.ft,
+            z_g=chapter_26.table_26_11_1.at["C", "z_g"],
+            alpha=chapter_26.table_26_11_1.at["C", "alpha"])
+
 def test_eq_26_10_1():
     string, q_h = chapter_26.eq_26_10_1(
         K_z=1.21,
@@ -91,6 +118,14 @@ def test_eq_26_10_1():
     assert isclose(q_h, 35.9817216*unit.psf, atol=1e-7*unit.psf)
     assert string == r"q_{h} &= 0.00256 \cdot K_{h} \cdot K_{zt} \cdot K_e \cdot V^2 = 0.00256 \cdot 1.21 \cdot 1 \cdot 0.96 \cdot \left(110\ \mathrm{mph}\right)^2 &= 35.98\ \mathrm{psf}"
 
+def test_eq_26_10_1_array_string():
+    with pytest.raises(ValueError):
+        chapter_26.eq_26_10_1(
+            K_z=array([1.0, 1.2]),
+            K_zt=1,
+            K_e=1,
+            V=115*unit.mph)
+
 def test_eq_26_11_6():
     string, G_x = chapter_26.eq_26_11_6(
         I_bar_z=0.285,
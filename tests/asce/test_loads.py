@@ -14,6 +14,7 @@
 
 
 from numpy import array, isclose
+import pandas as pd
 
 from structuraltools.asce.loads import (LoadCase, LoadCaseFactor, LoadCollector,
     LoadComb, LoadCombResult, reduce_combs)
@@ -31,6 +32,12 @@ def test_reduce_combs_already_reduced():
     reduced_reactions = reduce_combs(reactions)
     assert all(reduced_reactions.eq(reactions))
 
+def test_reduce_combs_duplicates():
+    combs = pd.DataFrame(
+        {"FX": [1*unit.kip, -2*unit.kip, 1*unit.kip], "FY": [3*unit.kip, 1*unit.kip, 3*unit.kip]},
+        index=["first", "second", "third"])
+    assert list(reduce_combs(combs).index) == ["second", "third"]
+
 
 class TestLoadComb:
     def setup_method(self, method):
@@ -58,6 +65,17 @@ class TestLoadComb:
             )
         }
 
+    def test_case_factors(self):
+        load_kinds = [
+            [LoadCase("D", "upD"), LoadCase("D", "D")],
+            [LoadCase("L", "L")],
+            [LoadCase("W", "W+"), LoadCase("W", "W-")]
+        ]
+        assert self.load_comb.case_factors(load_kinds) == [
+            (LoadCaseFactor("D", "upD", 1), LoadCaseFactor("L", "L", 2)),
+            (LoadCaseFactor("D", "D", 1), LoadCaseFactor("L", "L", 2))
+        ]
+
 
 class TestLoadCollector:
     def setup_method(self, method):
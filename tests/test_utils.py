@@ -76,3 +76,62 @@ def test_read_data_table():
 def test_pivot_dict_table():
     result = utils.pivot_dict_table({"a": {"1": 1, "2": 2}, "b": {"1": 3, "2": 4}})
     assert result == {"1": {"a": 1, "b": 3}, "2": {"a": 2, "b": 4}}
+
+def test_cache_values():
+    calls = []
+
+    @utils.cache_values
+    def calculation(value, **string_options):
+        calls.append(value)
+        return utils.fill_template(2*value, "{value}", locals(), **string_options)
+
+    assert calculation(1, return_string=False) == utils.Result("", 2)
+    assert calculation(1, return_string=False) == utils.Result("", 2)
+    assert calculation(1) == utils.Result("1", 2)
+    assert calls == [1, 1]
+
+def test_cache_values_errors():
+    calls = []
+
+    @utils.cache_values
+    def calculation(value, **string_options):
+        calls.append(value)
+        if value is None:
+            raise TypeError("value must be a number")
+        return utils.Result("", 2*value[0] if isinstance(value, list) else 2*value)
+
+    with pytest.raises(TypeError):
+        calculation(None, return_string=False)
+    assert calls == [None]
+    assert calculation([1], return_string=False) == utils.Result("", 2)
+    assert calls == [None, [1]]
+
+def test_cache_values_result_cache():
+    calls = []
+
+    class Section:
+        def __init__(self):
+            self.result_cache = {}
+
+    @utils.cache_values
+    def calculation(section, value, **string_options):
+        calls.append(value)
+        return utils.Result("", 2*value)
+
+    section = Section()
+    assert calculation(section, 1, return_string=False) == utils.Result("", 2)
+    assert calculation(section, 1, return_string=False) == utils.Result("", 2)
+    assert calls == [1]
+    section.result_cache.clear()
+    assert calculation(section, 1, return_string=False) == utils.Result("", 2)
+    assert calls == [1, 1]
+
+def test_compile_template():
+    render = utils.compile_template(
+        "{_header_}x = {x:.{_precision_}{_gformat_}} {{y}}", precision=3, header_level=2)
+    assert render({"x": 1.23456}) == "## x = 1.23 {y}"
+    assert utils.compile_template("{x}", precision=3) is utils.compile_template("{x}", precision=3)
+
+def test_compile_template_header_type():
+    render = utils.compile_template("{_h_start_}Title{_h_end_}", header_type="html")
+    assert render({}) == "<h4>Title</h4>"